@@ -1,12 +1,21 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import argparse
+import heapq
+import io
+import mmap
+import os
 import sys
 import logging
+import time
 
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
 
 from lib import setup
+from lib.cache import cached_inputs
 
 example_input = """1000
 2000
@@ -24,12 +33,13 @@ example_input = """1000
 10000
 """
 
-def read_inputs(example=0):
+@cached_inputs
+def read_inputs(example=0, filename='day1_input'):
     
     if (example):
         data = example_input
     else:
-        with open('day1_input', 'r', encoding='utf-8') as f:
+        with open(filename, 'r', encoding='utf-8') as f:
             data = f.read()
     
     data = data.splitlines()
@@ -60,14 +70,306 @@ def part2(calories : List[List[int]]) -> int:
     calories_per_elf = list(map(sum, calories))
     return sum(sorted(calories_per_elf)[-3:])
 
+def _open_input(example=0, filename='day1_input') -> BinaryIO:
+    
+    if (example):
+        return io.BytesIO(example_input.encode('utf-8'))
+    return open(filename, 'rb')
+
+def stream_totals(f: BinaryIO, chunk_size: int = 1 << 20) -> Iterator[int]:
+    """Read file in chunks and yield the total
+    of each blank-line delimited group.
+    """
+    total = 0
+    in_group = False
+    rest = b''
+    
+    while (chunk := f.read(chunk_size)):
+        lines = (rest + chunk).split(b'\n')
+        # last line may continue in next chunk
+        rest = lines.pop()
+        for line in lines:
+            if (line.strip()):
+                total += int(line)
+                in_group = True
+                continue
+            yield total
+            total = 0
+            in_group = False
+    
+    if (rest.strip()):
+        total += int(rest)
+        in_group = True
+    if (in_group):
+        yield total
+
+def solve_streaming(example=0, filename='day1_input', k=3) -> Tuple[int, int]:
+    """Solve both parts in a single pass over the input,
+    keeping only the top k totals.
+    """
+    with _open_input(example, filename) as f:
+        top = heapq.nlargest(k, stream_totals(f))
+    
+    return top[0], sum(top[:3])
+
+def solve_numpy(example=0, filename='day1_input', k=3) -> Tuple[int, int]:
+    """Solve both parts with vectorized parsing and reduction.
+    Requires NumPy.
+    """
+    import numpy as np
+    
+    with _open_input(example, filename) as f:
+        data = f.read()
+    if (not data.endswith(b'\n')):
+        data += b'\n'
+    
+    buf = np.frombuffer(data, dtype=np.uint8)
+    ends = np.flatnonzero(buf == ord('\n'))
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    
+    # lines with anything but digits are rare, strip and check them one by one
+    other = np.flatnonzero(((buf < ord('0')) | (buf > ord('9'))) & (buf != ord('\n')))
+    begins = starts.copy()
+    stops = ends.copy()
+    for line in np.unique(np.searchsorted(ends, other)):
+        text = data[starts[line]:ends[line]]
+        stripped = text.strip()
+        if (stripped and not stripped.isdigit()):
+            raise ValueError(f'Invalid calories on line {line + 1}: {text!r}')
+        begins[line] += len(text) - len(text.lstrip())
+        stops[line] = begins[line] + len(stripped)
+    blank = begins == stops
+    
+    # parse all lines at once, one decimal place per step
+    line_starts = begins[~blank]
+    lengths = (stops - begins)[~blank]
+    values = np.zeros(len(line_starts), dtype=np.int64)
+    for place in range(int(lengths.max(initial=0))):
+        active = lengths > place
+        digits = buf[np.where(active, line_starts + place, 0)].astype(np.int64) - ord('0')
+        values = np.where(active, values * 10 + digits, values)
+    
+    # segmented sum of lines to groups
+    group = np.cumsum(blank)[~blank]
+    group_starts = np.flatnonzero(np.diff(group, prepend=-1))
+    totals = np.add.reduceat(values, group_starts)
+    
+    top = np.sort(np.partition(totals, -k)[-k:] if (len(totals) > k) else totals)[::-1]
+    return int(top[0]), int(top[:3].sum())
+
+@dataclass
+class ChunkSummary:
+    # chunk contains at least one blank line
+    closed: bool
+    # total of lines before first blank line
+    head: int = 0
+    # top totals of groups entirely inside chunk
+    top: List[int] = field(default_factory=list)
+    # total of lines after last blank line
+    tail: int = 0
+    tail_lines: bool = False
+
+def _summarize_chunk(filename: str, begin: int, end: int, k: int) -> ChunkSummary:
+    
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        lines = mm[begin:end].split(b'\n')
+    # chunks end on line boundaries
+    if (lines[-1] == b''):
+        lines.pop()
+    
+    summary = ChunkSummary(False)
+    top : List[int] = []
+    total = 0
+    in_group = False
+    
+    for line in lines:
+        if (line.strip()):
+            total += int(line)
+            in_group = True
+            continue
+        if (not summary.closed):
+            summary.closed = True
+            summary.head = total
+        elif (len(top) < k):
+            heapq.heappush(top, total)
+        else:
+            heapq.heappushpop(top, total)
+        total = 0
+        in_group = False
+    
+    summary.top = top
+    summary.tail = total
+    summary.tail_lines = in_group
+    return summary
+
+def _split_chunks(filename: str, chunk_size: int) -> List[Tuple[int, int]]:
+    """Split file into byte ranges of about chunk_size
+    that begin and end on line boundaries.
+    """
+    size = os.path.getsize(filename)
+    if (size == 0):
+        return []
+    
+    chunks = []
+    begin = 0
+    with open(filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        while (begin < size):
+            end = mm.find(b'\n', min(begin + chunk_size, size) - 1)
+            end = size if (end < 0) else end + 1
+            chunks.append((begin, end))
+            begin = end
+    
+    return chunks
+
+def solve_parallel(example=0, filename='day1_input', k=3, workers=None, chunk_size=64 << 20) -> Tuple[int, int]:
+    """Solve both parts by summarizing chunks of the input in worker processes.
+    Groups spanning chunk boundaries are stitched together from the
+    chunks' heads and tails.
+    """
+    if (example):
+        return solve_streaming(example, filename, k)
+    
+    chunks = _split_chunks(filename, chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        summaries = list(pool.map(_summarize_chunk, *zip(*((filename, begin, end, k) for begin, end in chunks))))
+    
+    totals = []
+    carry = 0
+    carry_lines = False
+    
+    for summary in summaries:
+        if (not summary.closed):
+            # group continues through whole chunk
+            carry += summary.tail
+            carry_lines = carry_lines or summary.tail_lines
+            continue
+        totals.append(carry + summary.head)
+        totals.extend(summary.top)
+        carry = summary.tail
+        carry_lines = summary.tail_lines
+    
+    if (carry_lines):
+        totals.append(carry)
+    
+    top = heapq.nlargest(k, totals)
+    return top[0], sum(top[:3])
+
+class CalorieFollower:
+    """Track top k totals of a growing calorie log.
+    Only bytes appended since the last poll are read.
+    """
+    def __init__(self, filename: str, k=3):
+        self.filename = filename
+        self.k = k
+        self.offset = 0
+        self.rest = b''
+        self.total = 0
+        # whether the group in progress has any lines yet
+        self.pending = False
+        self.top : List[int] = []
+    
+    def reset(self):
+        self.offset = 0
+        self.rest = b''
+        self.total = 0
+        self.pending = False
+        self.top = []
+    
+    def feed(self, data: bytes) -> int:
+        """Process appended bytes and return number of completed groups."""
+        lines = (self.rest + data).split(b'\n')
+        # last line may still be written to
+        self.rest = lines.pop()
+        completed = 0
+        
+        for line in lines:
+            if (line.strip()):
+                self.total += int(line)
+                self.pending = True
+                continue
+            if (len(self.top) < self.k):
+                heapq.heappush(self.top, self.total)
+            else:
+                heapq.heappushpop(self.top, self.total)
+            self.total = 0
+            self.pending = False
+            completed += 1
+        
+        return completed
+    
+    def poll(self) -> int:
+        """Read bytes appended to file and return number of completed groups."""
+        with open(self.filename, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if (size < self.offset):
+                logging.warning(f'{self.filename} was truncated, starting over')
+                self.reset()
+            f.seek(self.offset)
+            data = f.read(size - self.offset)
+        
+        self.offset += len(data)
+        return self.feed(data)
+    
+    def answers(self) -> Optional[Tuple[int, int]]:
+        """Answers for the file as read so far. The last group
+        counts even if no blank line follows it yet.
+        """
+        totals = list(self.top)
+        # group in progress is a candidate, but not final
+        if (self.pending or self.rest.strip()):
+            totals.append(self.total + (int(self.rest) if (self.rest.strip()) else 0))
+        if (not totals):
+            return None
+        top = heapq.nlargest(self.k, totals)
+        return top[0], sum(top[:3])
+
+def follow(filename='day1_input', interval=1.0, k=3):
+    """Watch filename for appended lines and log both answers
+    whenever they change. Runs until interrupted.
+    """
+    follower = CalorieFollower(filename, k)
+    last = None
+    
+    try:
+        while (True):
+            follower.poll()
+            answers = follower.answers()
+            if (answers is not None and answers != last):
+                max_calories, top_calories = answers
+                logging.info(f'Part 1: Max Calories {max_calories}')
+                logging.info(f'Part 2: Top 3 Calories {top_calories}')
+                last = answers
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+def install_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--engine', help='Solver engine, one of \'lists\' (default), \'stream\', \'numpy\', \'parallel\'.', type=str, choices=['lists', 'stream', 'numpy', 'parallel'], default='lists')
+    parser.add_argument('--follow', help='Watch input for appended lines and update answers as lines arrive.', action='store_true')
+    parser.add_argument('--interval', help='Polling interval in seconds for --follow (default: 1).', type=float, default=1.0)
+    parser.add_argument('--workers', help='Number of worker processes for parallel engine (default: number of CPUs).', type=int, default=None)
+
 def main(args):
     
-    calorie_lists = read_inputs(args.example)
-    max_calories = part1(calorie_lists)
+    if (args.follow):
+        follow(args.input, args.interval)
+        return
+    
+    match (args.engine):
+        case 'stream':
+            max_calories, top_calories = solve_streaming(args.example, args.input)
+        case 'numpy':
+            max_calories, top_calories = solve_numpy(args.example, args.input)
+        case 'parallel':
+            max_calories, top_calories = solve_parallel(args.example, args.input, workers=args.workers)
+        case _:
+            calorie_lists = read_inputs(args.example, args.input)
+            max_calories = part1(calorie_lists)
+            top_calories = part2(calorie_lists)
+    
     logging.info(f'Part 1: Max Calories {max_calories}')
-    top_calories = part2(calorie_lists)
     logging.info(f'Part 2: Top 3 Calories {top_calories}')
 
 if __name__ == '__main__':
-    args = setup()
+    args = setup(install_arguments)
     sys.exit(main(args))
@@ -8,6 +8,8 @@ from abc import ABC, abstractmethod
 from typing import ClassVar, Dict, List, Optional, Tuple
 
 from lib import setup
+from lib.cache import cached_inputs
+from lib.render import Canvas, Viewport
 
 example1_input = """noop
 addx 3
@@ -214,7 +216,8 @@ class AddX(Opcode):
     def execute(self, registers: RegisterFile):
         registers['X'] += self.value
 
-def read_inputs(example=0) -> List[Opcode]:
+@cached_inputs
+def read_inputs(example=0, filename='day10_input') -> List[Opcode]:
     
     match (example):
         case 1:
@@ -222,7 +225,7 @@ def read_inputs(example=0) -> List[Opcode]:
         case _ if (example):
             data = example2_input
         case _:
-            with open('day10_input', 'r', encoding='utf-8') as f:
+            with open(filename, 'r', encoding='utf-8') as f:
                 data = f.read()
     
     data = data.splitlines()
@@ -269,7 +272,7 @@ def part2(opcodes: List[Opcode]) -> str:
     
     cpu = CPU()
     cycle = 1
-    display = [['.' for _ in range(40)] for _ in range(6)]
+    display = Canvas(Viewport(0, 0, 40, 6))
     
     for opcode in opcodes:
         # record registers during cycle
@@ -280,16 +283,19 @@ def part2(opcodes: List[Opcode]) -> str:
         for cycle in range(cycle, cpu.cycles):
             y = (cycle - 1) // 40
             x = (cycle - 1) % 40
+            # CRT only shows the first 240 cycles
+            if (y >= display.viewport.h):
+                break
             if any(v == registers['X'] for v in [x + 1, x, x - 1]):
-                display[y][x] = '#'
+                display.put(x, y, '#')
         cycle = cpu.cycles
     
     # return the CRT display
-    return '\n'.join(''.join(display[y]) for y in range(6))
+    return display.render()
 
 def main(args):
     
-    opcodes = read_inputs(args.example)
+    opcodes = read_inputs(args.example, args.input)
     signal_stengths = part1(opcodes)
     logging.info(f'Part 1: Sum of Signal Stengths = {signal_stengths}')
     display = part2(opcodes)
@@ -10,6 +10,7 @@ from math import prod
 from typing import Dict, List, Optional, Tuple
 
 from lib import setup
+from lib.cache import cached_inputs
 
 example_input = """Monkey 0:
   Starting items: 79, 98
@@ -82,13 +83,14 @@ class Monkey:
     operation: Optional[Operation] = None
     test: Optional[Test] = None
 
-def read_inputs(example=0) -> List[Monkey]:
+@cached_inputs
+def read_inputs(example=0, filename='day11_input') -> List[Monkey]:
     
     match (example):
         case _ if (example):
             data = example_input
         case _:
-            with open('day11_input', 'r', encoding='utf-8') as f:
+            with open(filename, 'r', encoding='utf-8') as f:
                 data = f.read()
     
     data = data.splitlines()
@@ -163,7 +165,7 @@ def part2(monkeys: List[Monkey]) -> int:
 
 def main(args):
     
-    monkeys = read_inputs(args.example)
+    monkeys = read_inputs(args.example, args.input)
     monkey_business = part1(deepcopy(monkeys))
     logging.info(f'Part 1: level of monkey business is {monkey_business[0][1] * monkey_business[1][1]} (monkeys {monkey_business[0][0]}, {monkey_business[1][0]})')
     monkey_business = part2(deepcopy(monkeys))
@@ -9,6 +9,7 @@ from sortedcontainers import SortedListWithKey
 from typing import cast, Dict, List, Optional, Tuple, Union
 
 from lib import setup
+from lib.cache import cached_inputs
 
 example_input = """Sabqponm
 abcryxxl
@@ -49,13 +50,14 @@ class Node:
     def y(self):
         return self.pos.y
 
-def read_inputs(example=0) -> Tuple[ElevationMap, Point, Point]:
+@cached_inputs
+def read_inputs(example=0, filename='day12_input') -> Tuple[ElevationMap, Point, Point]:
     
     match (example):
         case _ if (example):
             data = example_input
         case _:
-            with open('day12_input', 'r', encoding='utf-8') as f:
+            with open(filename, 'r', encoding='utf-8') as f:
                 data = f.read()
     
     data = data.splitlines()
@@ -147,7 +149,7 @@ def part2(m: ElevationMap, s: Point, e: Point) -> int:
 
 def main(args):
     
-    m, s, e = read_inputs(args.example)
+    m, s, e = read_inputs(args.example, args.input)
     fewest_steps = part1(m, s, e)
     logging.info(f'Part 1: fewest steps {fewest_steps}')
     fewest_steps_scenic = part2(m, s, e)
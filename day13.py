@@ -10,6 +10,7 @@ from itertools import zip_longest
 from typing import Dict, List, Optional, Tuple, Union
 
 from lib import setup
+from lib.cache import cached_inputs
 
 example_input = """[1,1,3,1,1]
 [1,1,5,1,1]
@@ -57,13 +58,14 @@ class Pair:
     lhs: Packet
     rhs: Packet
 
-def read_inputs(example=0) -> List[Pair]:
+@cached_inputs
+def read_inputs(example=0, filename='day13_input') -> List[Pair]:
     
     match (example):
         case _ if (example):
             data = example_input
         case _:
-            with open('day13_input', 'r', encoding='utf-8') as f:
+            with open(filename, 'r', encoding='utf-8') as f:
                 data = f.read()
     
     data = data.splitlines()
@@ -150,7 +152,7 @@ def part2():
 
 def main(args):
     
-    pairs = read_inputs(args.example)
+    pairs = read_inputs(args.example, args.input)
     sorted_pairs = part1(pairs)
     logging.info(f'Part 1: sorted pair indice sum {sum(p.index for p in sorted_pairs)} (pairs {", ".join(str(p.index) for p in sorted_pairs)})')
     part2()
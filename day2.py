@@ -1,14 +1,18 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import argparse
+import io
 import sys
 import logging
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from operator import add, mul
+from typing import BinaryIO, Dict, List, Optional, Tuple
 
-from lib import setup
+from lib import log_enabled, setup
+from lib.cache import cached_inputs
 
 example_input = """A Y
 B X
@@ -40,7 +44,8 @@ class YourHand(Enum):
     
     def score(self, other: OppHand) -> int:
         
-        logging.debug(f'Mine {self} Other {other}')
+        if (log_enabled(logging.DEBUG)):
+            logging.debug(f'Mine {self} Other {other}')
         
         if self.beats == other:
             # won
@@ -79,12 +84,106 @@ class Round:
     theirs: OppHand
     result: Result
 
-def read_inputs(example=0) -> List[Round]:
+def _make_score_tables() -> Tuple[List[int], List[int]]:
+    """Score of both parts for all nine lines,
+    indexed by 3 * opponent's hand + right column.
+    """
+    part1 = [0] * 9
+    part2 = [0] * 9
+    
+    for o, other in enumerate(OppHand):
+        for r, (hand, result) in enumerate(zip(YourHand, Result)):
+            part1[3 * o + r] = hand.score(other)
+            part2[3 * o + r] = result.resolve(other)
+    
+    return part1, part2
+
+SCORES_PART1, SCORES_PART2 = _make_score_tables()
+
+# map letters to their share of the score table index
+OPP_INDEX = bytes.maketrans(b'ABC', bytes([0, 3, 6]))
+RIGHT_INDEX = bytes.maketrans(b'XYZ', bytes([0, 1, 2]))
+
+def _check_lines(data: bytes) -> bytes:
+    """Make sure every line is exactly 'L R' with L in ABC and R in XYZ,
+    return lines with '\n' endings, four bytes each.
+    """
+    data = data.replace(b'\r\n', b'\n')
+    if (data and not data.endswith(b'\n')):
+        data += b'\n'
+    
+    num_lines = len(data) // 4
+    if (len(data) % 4 or data[1::4] != b' ' * num_lines or data[3::4] != b'\n' * num_lines):
+        raise RuntimeError('Encountered invalid line in strategy guide!')
+    if (data[0::4].translate(None, b'ABC') or data[2::4].translate(None, b'XYZ')):
+        raise RuntimeError('Encountered invalid line in strategy guide!')
+    
+    return data
+
+def _score_indices(data: bytes) -> List[int]:
+    
+    data = _check_lines(data)
+    return list(map(add, data[0::4].translate(OPP_INDEX), data[2::4].translate(RIGHT_INDEX)))
+
+def solve_lut(example=0, filename='day2_input') -> Tuple[int, int]:
+    """Score both parts by table lookup on the raw input,
+    without creating Round instances.
+    """
+    if (example):
+        data = example_input.encode('utf-8')
+    else:
+        with open(filename, 'rb') as f:
+            data = f.read()
+    
+    indices = _score_indices(data)
+    return sum(map(SCORES_PART1.__getitem__, indices)), sum(map(SCORES_PART2.__getitem__, indices))
+
+# all nine lines as checked by _check_lines, in score table order
+LINES = [bytes([lhs, ord(' '), rhs, ord('\n')]) for lhs in b'ABC' for rhs in b'XYZ']
+
+def histogram(f: BinaryIO, chunk_size: int = 1 << 24) -> List[int]:
+    """Count occurrences of each of the nine lines in file,
+    reading it in chunks and in score table order.
+    """
+    counts = [0] * 9
+    rest = b''
+    
+    while (chunk := f.read(chunk_size)):
+        chunk = rest + chunk
+        # only count complete lines
+        end = chunk.rfind(b'\n') + 1
+        chunk, rest = chunk[:end], chunk[end:]
+        _count_lines(chunk, counts)
+    
+    _count_lines(rest, counts)
+    return counts
+
+def _count_lines(data: bytes, counts: List[int]):
+    
+    data = _check_lines(data)
+    # lines are four bytes ending in '\n', so matches never straddle lines
+    for i, line in enumerate(LINES):
+        counts[i] += data.count(line)
+
+def solve_histogram(example=0, filename='day2_input') -> Tuple[int, int]:
+    """Score both parts from the number of occurrences of each line."""
+    if (example):
+        f = io.BytesIO(example_input.encode('utf-8'))
+    else:
+        f = open(filename, 'rb')
+    
+    with f:
+        counts = histogram(f)
+    
+    return sum(map(mul, counts, SCORES_PART1)), sum(map(mul, counts, SCORES_PART2))
+
+@cached_inputs
+def read_inputs(example=0, filename='day2_input') -> List[Round]:
     
     if (example):
         data = example_input
     else:
-        with open('day2_input', 'r', encoding='utf-8') as f:
+        with open(filename, 'r', encoding='utf-8') as f:
             data = f.read()
     
     data = data.splitlines()
@@ -113,14 +212,24 @@ def part2(rounds: List[Round]) -> int:
     
     return total
 
+def install_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--engine', help='Solver engine, one of \'rounds\' (default), \'lut\', \'histogram\'.', type=str, choices=['rounds', 'lut', 'histogram'], default='rounds')
+
 def main(args):
     
-    rounds = read_inputs(args.example)
-    score = part1(rounds)
-    logging.info(f'Part 1: Score {score}')
-    score = part2(rounds)
-    logging.info(f'Part 2: Adjusted Score {score}')
+    match (args.engine):
+        case 'lut':
+            score1, score2 = solve_lut(args.example, args.input)
+        case 'histogram':
+            score1, score2 = solve_histogram(args.example, args.input)
+        case _:
+            rounds = read_inputs(args.example, args.input)
+            score1 = part1(rounds)
+            score2 = part2(rounds)
+    
+    logging.info(f'Part 1: Score {score1}')
+    logging.info(f'Part 2: Adjusted Score {score2}')
 
 if __name__ == '__main__':
-    args = setup()
+    args = setup(install_arguments)
     sys.exit(main(args))
@@ -1,15 +1,18 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import argparse
+import string
 import sys
 import logging
 
 from dataclasses import dataclass
 from functools import reduce
 from itertools import zip_longest
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from lib import setup
+from lib.cache import cached_inputs
 
 example_input = """vJrwpWtwJgWrhcsFMMfFFhFp
 jqHRNqRjqzjGDLGLrsFMfFZSrLrFZsSL
@@ -24,12 +27,13 @@ class Rucksack:
     lhs: str
     rhs: str
 
-def read_inputs(example=0) -> List[Rucksack]:
+@cached_inputs
+def read_inputs(example=0, filename='day3_input') -> List[Rucksack]:
     
     if (example):
         data = example_input
     else:
-        with open('day3_input', 'r', encoding='utf-8') as f:
+        with open(filename, 'r', encoding='utf-8') as f:
             data = f.read()
     
     data = data.splitlines()
@@ -67,14 +71,96 @@ def part2(rucksacks: List[Rucksack]):
     
     return priorities
 
+# all item types ordered by priority
+ITEMS = ''.join(sorted(string.ascii_letters, key=get_priority)).encode('ascii')
+# one bit per item type, the top bit of its byte in ITEMS
+PRESENT = b'\x80'
+ITEM_BITS = int.from_bytes(PRESENT * len(ITEMS), 'little')
+
+def item_mask(items: bytes) -> int:
+    """Mask of item types in items, built by translating ITEMS
+    so that present item types become 0x80 in a single pass.
+    """
+    return int.from_bytes(ITEMS.translate(bytes.maketrans(items, PRESENT * len(items))), 'little') & ITEM_BITS
+
+def mask_priority(mask: int) -> int:
+    """Priority of item with lowest bit in mask."""
+    return (mask & -mask).bit_length() >> 3
+
+def part1_bitmask(rucksacks: List[Rucksack]) -> int:
+    
+    priorities = 0
+    for rucksack in rucksacks:
+        priorities += mask_priority(item_mask(rucksack.lhs.encode('ascii')) & item_mask(rucksack.rhs.encode('ascii')))
+    
+    return priorities
+
+def part2_bitmask(rucksacks: List[Rucksack]) -> int:
+    
+    priorities = 0
+    for first, second, third in zip_longest(*(iter(rucksacks),) * 3):
+        # OR compartments instead of concatenating them
+        badge = ((item_mask(first.lhs.encode('ascii')) | item_mask(first.rhs.encode('ascii')))
+                 & (item_mask(second.lhs.encode('ascii')) | item_mask(second.rhs.encode('ascii')))
+                 & (item_mask(third.lhs.encode('ascii')) | item_mask(third.rhs.encode('ascii'))))
+        priorities += mask_priority(badge)
+    
+    return priorities
+
+def _iter_lines(example=0, filename='day3_input') -> Iterator[bytes]:
+    
+    if (example):
+        yield from example_input.encode('ascii').splitlines()
+        return
+    with open(filename, 'rb') as f:
+        for line in f:
+            yield line.rstrip(b'\r\n')
+
+def rucksack_masks(lines: Iterator[bytes]) -> Iterator[Tuple[int, int]]:
+    """Item masks of both compartments of each rucksack."""
+    for line in lines:
+        items = len(line) // 2
+        yield item_mask(line[:items]), item_mask(line[items:])
+
+def solve_streaming(example=0, filename='day3_input') -> Tuple[int, int]:
+    """Both parts in a single pass over the input,
+    holding only the masks of the current group.
+    """
+    priorities = 0
+    badge_priorities = 0
+    group = [0, 0, 0]
+    
+    for ix, (lhs, rhs) in enumerate(rucksack_masks(_iter_lines(example, filename))):
+        priorities += mask_priority(lhs & rhs)
+        slot = ix % 3
+        group[slot] = lhs | rhs
+        if (slot == 2):
+            badge_priorities += mask_priority(group[0] & group[1] & group[2])
+    
+    return priorities, badge_priorities
+
+def install_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--engine', help='Solver engine, one of \'sets\' (default), \'bitmask\', \'stream\'.', type=str, choices=['sets', 'bitmask', 'stream'], default='sets')
+
 def main(args):
     
-    rucksacks = read_inputs(args.example)
-    sum_priorities = part1(rucksacks)
+    match (args.engine):
+        case 'stream':
+            sum_priorities, badge_sum_priorities = solve_streaming(args.example, args.input)
+            logging.info(f'Part 1: Sum of Priorities {sum_priorities}')
+            logging.info(f'Part 2: Sum of Badge Priorities {badge_sum_priorities}')
+            return
+        case 'bitmask':
+            solve1, solve2 = part1_bitmask, part2_bitmask
+        case _:
+            solve1, solve2 = part1, part2
+    
+    rucksacks = read_inputs(args.example, args.input)
+    sum_priorities = solve1(rucksacks)
     logging.info(f'Part 1: Sum of Priorities {sum_priorities}')
-    badge_sum_priorities = part2(rucksacks)
+    badge_sum_priorities = solve2(rucksacks)
     logging.info(f'Part 2: Sum of Badge Priorities {badge_sum_priorities}')
 
 if __name__ == '__main__':
-    args = setup()
+    args = setup(install_arguments)
     sys.exit(main(args))
@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import argparse
+import bisect
+import io
 import sys
 import logging
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, List, Optional, Tuple
 
 from lib import setup
+from lib.cache import cached_inputs
 
 example_input = """2-4,6-8
 2-3,4-5
@@ -41,12 +45,54 @@ class ElfPair:
     lhs: Section
     rhs: Section
 
-def read_inputs(example=0) -> List[ElfPair]:
+class SectionIndex:
+    """Index over all sections of a roster.
+    
+    Built in O(n log n), answers coverage of a section id and whether an
+    assignment overlaps or contains any other assignment in O(log n).
+    """
+    def __init__(self, sections: List[Section]):
+        # sections ordered by begin, then end
+        self.keys = sorted((section.begin, section.end) for section in sections)
+        self.begins = [begin for begin, _ in self.keys]
+        self.ends = sorted(end for _, end in self.keys)
+        # smallest end from each position on
+        self.suffix_min_end = [0] * (len(self.keys) + 1)
+        self.suffix_min_end[-1] = sys.maxsize
+        for ix in range(len(self.keys) - 1, -1, -1):
+            self.suffix_min_end[ix] = min(self.keys[ix][1], self.suffix_min_end[ix + 1])
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    def coverage(self, section_id: int) -> int:
+        """Number of assignments covering section_id."""
+        return bisect.bisect_right(self.begins, section_id) - bisect.bisect_left(self.ends, section_id)
+    
+    def overlapping(self, section: Section) -> int:
+        """Number of assignments overlapping section."""
+        return bisect.bisect_right(self.begins, section.end) - bisect.bisect_left(self.ends, section.begin)
+    
+    def overlaps_other(self, section: Section) -> bool:
+        """Whether section, which is part of the roster, overlaps any other assignment."""
+        return self.overlapping(section) > 1
+    
+    def contains_other(self, section: Section) -> bool:
+        """Whether section, which is part of the roster, contains any other assignment."""
+        pos = bisect.bisect_left(self.keys, (section.begin, section.end))
+        # assignments before pos with the same begin end earlier
+        if (bisect.bisect_left(self.begins, section.begin) < pos):
+            return True
+        # any assignment after pos begins no earlier
+        return self.suffix_min_end[pos + 1] <= section.end
+
+@cached_inputs
+def read_inputs(example=0, filename='day4_input') -> List[ElfPair]:
     
     if (example):
         data = example_input
     else:
-        with open('day4_input', 'r', encoding='utf-8') as f:
+        with open(filename, 'r', encoding='utf-8') as f:
             data = f.read()
     
     data = data.splitlines()
@@ -85,14 +131,78 @@ def part2(elf_pairs: List[ElfPair]) -> int:
     
     return overlap
 
+def roster(elf_pairs: List[ElfPair]) -> Tuple[int, int]:
+    """Number of assignments overlapping and containing
+    any other assignment in the whole roster.
+    """
+    sections = [section for elf_pair in elf_pairs for section in (elf_pair.lhs, elf_pair.rhs)]
+    index = SectionIndex(sections)
+    
+    overlapping = sum(1 for section in sections if index.overlaps_other(section))
+    containing = sum(1 for section in sections if index.contains_other(section))
+    return overlapping, containing
+
+def _open_input(example=0, filename='day4_input') -> BinaryIO:
+    
+    if (example):
+        return io.BytesIO(example_input.encode('utf-8'))
+    return open(filename, 'rb')
+
+def read_columns(example=0, filename='day4_input'):
+    """Parse all assignments into an (n, 4) array of
+    lhs begin, lhs end, rhs begin and rhs end.
+    Requires NumPy.
+    """
+    import numpy as np
+    
+    with _open_input(example, filename) as f:
+        data = f.read().replace(b'\r\n', b'\n')
+    if (data and not data.endswith(b'\n')):
+        data += b'\n'
+    num_lines = data.count(b'\n')
+    
+    # every line is 'a-b,c-d', so without digits only the separators remain
+    if (data.translate(None, b'0123456789') != b'-,-\n' * num_lines):
+        raise ValueError('Encountered invalid line in section assignments!')
+    
+    values = np.fromstring(data.translate(bytes.maketrans(b',-', b'  ')), dtype=np.int64, sep=' ')
+    # and none of the four numbers is missing
+    if (len(values) != 4 * num_lines):
+        raise ValueError('Encountered invalid line in section assignments!')
+    return values.reshape(-1, 4)
+
+def solve_numpy(example=0, filename='day4_input') -> Tuple[int, int]:
+    """Solve both parts with vectorized comparisons.
+    Requires NumPy.
+    """
+    lhs_begin, lhs_end, rhs_begin, rhs_end = read_columns(example, filename).T
+    
+    contains = ((lhs_begin <= rhs_begin) & (lhs_end >= rhs_end)) | ((rhs_begin <= lhs_begin) & (rhs_end >= lhs_end))
+    overlap = (lhs_begin <= rhs_end) & (rhs_begin <= lhs_end)
+    return int(contains.sum()), int(overlap.sum())
+
+def install_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--engine', help='Solver engine, one of \'sections\' (default), \'numpy\'.', type=str, choices=['sections', 'numpy'], default='sections')
+    parser.add_argument('--roster', help='Also check assignments against the whole roster.', action='store_true')
+
 def main(args):
     
-    elf_pairs = read_inputs(args.example)
-    need_reassignment = part1(elf_pairs)
+    match (args.engine):
+        case 'numpy':
+            need_reassignment, overlap_assignment = solve_numpy(args.example, args.input)
+        case _:
+            elf_pairs = read_inputs(args.example, args.input)
+            need_reassignment = part1(elf_pairs)
+            overlap_assignment = part2(elf_pairs)
+    
     logging.info(f'Part 1: {need_reassignment} elf pairs need reassignment')
-    overlap_assignment = part2(elf_pairs)
     logging.info(f'Part 2: {overlap_assignment} elf pairs overlap')
+    
+    if (args.roster):
+        elf_pairs = read_inputs(args.example, args.input)
+        overlapping, containing = roster(elf_pairs)
+        logging.info(f'Roster: {overlapping} of {2 * len(elf_pairs)} assignments overlap and {containing} contain another assignment')
 
 if __name__ == '__main__':
-    args = setup()
+    args = setup(install_arguments)
     sys.exit(main(args))
@@ -1,15 +1,18 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import argparse
 import sys
 import logging
 import re
 
-from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Dict, List, Optional, Tuple
 
-from lib import setup
+from lib import log_enabled, setup
+from lib.cache import cached_inputs
+from lib.render import Canvas, FrameThrottle, clip
 
 example_input = """    [D]    
 [N] [C]    
@@ -25,6 +28,20 @@ move 1 from 1 to 2
 @dataclass
 class Stack:
     crates : List[str] = field(default_factory=list)
+    
+    def move(self, dst: 'Stack', num: int, reverse: bool = True):
+        """Move top num crates onto dst in O(num),
+        one at a time (reverse) or all at once.
+        """
+        begin = len(self.crates) - num
+        moved = self.crates[begin:]
+        if (reverse):
+            moved.reverse()
+        dst.crates.extend(moved)
+        del self.crates[begin:]
+    
+    def clone(self) -> 'Stack':
+        return Stack(self.crates.copy())
 
 @dataclass
 class Command:
@@ -34,12 +51,13 @@ class Command:
 
 COMMAND_PATTERN = re.compile(r'move (\d+) from (\d+) to (\d+)')
 
-def read_inputs(example=0) -> Tuple[List[Stack], List[Command]]:
+@cached_inputs
+def read_inputs(example=0, filename='day5_input') -> Tuple[List[Stack], List[Command]]:
     
     if (example):
         data = example_input
     else:
-        with open('day5_input', 'r', encoding='utf-8') as f:
+        with open(filename, 'r', encoding='utf-8') as f:
             data = f.read()
     
     data = data.splitlines()
@@ -86,35 +104,36 @@ def read_inputs(example=0) -> Tuple[List[Stack], List[Command]]:
 def _draw_stacks(stacks: List[Stack]):
     
     max_height = max(len(stack.crates) for stack in stacks)
-    image = ''
+    # stack labels go below level 0, keep top crates in view
+    viewport = clip(0, -1, 4 * len(stacks), max_height + 1, focus=(2 * len(stacks), max_height))
+    canvas = Canvas(viewport, background=' ', y_up=True)
     
-    for height in range(max_height - 1, -1, -1):
-        line = ''
-        for stack in stacks:
-            if (len(stack.crates) <= height):
-                line += '    '
-            else:
-                line += f'[{stack.crates[height]}] '
-        image += line
-        image += '\n'
+    for sid, stack in enumerate(stacks):
+        for height in range(max(viewport.y, 0), min(len(stack.crates), viewport.y + viewport.h)):
+            canvas.text(sid * 4, height, f'[{stack.crates[height]}]')
+        canvas.text(sid * 4, -1, f' {sid + 1}  ')
     
-    image += (''.join(f' {i}  ' for i in range(1, len(stacks) + 1)))
-    logging.info(image)
+    logging.info(canvas.render())
 
 def part1(stacks: List[Stack], commands: List[Command]) -> str:
     
+    verbose = log_enabled(logging.INFO)
+    frames = FrameThrottle()
+    
     # draw initial state
-    _draw_stacks(stacks)
+    if (verbose and frames.ready()):
+        _draw_stacks(stacks)
     
     for command in commands:
         
-        logging.info(f'Move {command.num} from {command.src} to {command.dst}')
+        if (verbose):
+            logging.info(f'Move {command.num} from {command.src} to {command.dst}')
         
         src = stacks[command.src - 1]
         dst = stacks[command.dst - 1]
-        dst.crates += src.crates[:-command.num-1:-1]
-        src.crates = src.crates[:-command.num]
-        _draw_stacks(stacks)
+        src.move(dst, command.num)
+        if (verbose and frames.ready()):
+            _draw_stacks(stacks)
     
     labels = ''
     # determine top crates
@@ -126,18 +145,23 @@ def part1(stacks: List[Stack], commands: List[Command]) -> str:
 
 def part2(stacks: List[Stack], commands: List[Command]) -> str:
     
+    verbose = log_enabled(logging.INFO)
+    frames = FrameThrottle()
+    
     # draw initial state
-    _draw_stacks(stacks)
+    if (verbose and frames.ready()):
+        _draw_stacks(stacks)
     
     for command in commands:
         
-        logging.info(f'Move {command.num} from {command.src} to {command.dst}')
+        if (verbose):
+            logging.info(f'Move {command.num} from {command.src} to {command.dst}')
         
         src = stacks[command.src - 1]
         dst = stacks[command.dst - 1]
-        dst.crates += src.crates[-command.num:]
-        src.crates = src.crates[:-command.num]
-        _draw_stacks(stacks)
+        src.move(dst, command.num, reverse=False)
+        if (verbose and frames.ready()):
+            _draw_stacks(stacks)
     
     labels = ''
     # determine top crates
@@ -147,14 +171,57 @@ def part2(stacks: List[Stack], commands: List[Command]) -> str:
     
     return labels
 
+def top_crates(stacks: List[Stack], commands: List[Command], reverse: bool = True) -> str:
+    """Top crates after all commands without moving any crates.
+    
+    Only stack heights are tracked going forward. Then the position of each
+    final top crate is followed backwards through the commands to where it
+    started, so cost is O(commands * stacks) independent of the number of crates.
+    """
+    heights = [len(stack.crates) for stack in stacks]
+    for command in commands:
+        heights[command.src - 1] -= command.num
+        heights[command.dst - 1] += command.num
+    
+    # (stack, depth below top) of each final top crate
+    positions = [(sid, 0) for sid, height in enumerate(heights) if (height > 0)]
+    
+    for command in reversed(commands):
+        src = command.src - 1
+        dst = command.dst - 1
+        for ix, (sid, depth) in enumerate(positions):
+            if (sid == dst):
+                if (depth < command.num):
+                    positions[ix] = (src, command.num - 1 - depth if (reverse) else depth)
+                else:
+                    positions[ix] = (sid, depth - command.num)
+            elif (sid == src):
+                positions[ix] = (sid, depth + command.num)
+    
+    return ''.join(stacks[sid].crates[-1 - depth] for sid, depth in positions)
+
+def install_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--engine', help='Solver engine, one of \'simulate\' (default), \'replay\'.', type=str, choices=['simulate', 'replay'], default='simulate')
+
 def main(args):
     
-    stacks, commands = read_inputs(args.example)
-    crates_on_top = part1(deepcopy(stacks), commands)
+    stacks, commands = read_inputs(args.example, args.input)
+    
+    match (args.engine):
+        case 'replay':
+            solve1 = partial(top_crates, reverse=True)
+            solve2 = partial(top_crates, reverse=False)
+            # top_crates never moves crates, so stacks can be shared
+            clone = False
+        case _:
+            solve1, solve2 = part1, part2
+            clone = True
+    
+    crates_on_top = solve1([stack.clone() for stack in stacks] if (clone) else stacks, commands)
     logging.info(f'Part 1: Crates on top {crates_on_top}')
-    crates_on_top = part2(deepcopy(stacks), commands)
+    crates_on_top = solve2([stack.clone() for stack in stacks] if (clone) else stacks, commands)
     logging.info(f'Part 2: Crates on top {crates_on_top}')
 
 if __name__ == '__main__':
-    args = setup()
+    args = setup(install_arguments)
     sys.exit(main(args))
@@ -1,19 +1,24 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import argparse
+import io
 import sys
 import logging
 
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Dict, Iterable, List, Optional, Tuple
 
 from lib import setup
+from lib.cache import cached_inputs
 
 example1_input = """bvwbjplbgvbhsrlpgdmjqwftvncz"""
 example2_input = """nppdvjthqldpwncqszvftbrmjlhg"""
 example3_input = """nznrnfrfntjfmvfwmzdfjlvtqnbhcprsg"""
 example4_input = """zcfzfwzzqfrljwzlrfnpqdbhtmscgvjw"""
 
-def read_inputs(example=0) -> str:
+@cached_inputs
+def read_inputs(example=0, filename='day6_input') -> str:
     
     match (example):
         case 1:
@@ -25,7 +30,7 @@ def read_inputs(example=0) -> str:
         case 4:
             data = example4_input
         case other:
-            with open('day6_input', 'r', encoding='utf-8') as f:
+            with open(filename, 'r', encoding='utf-8') as f:
                 data = f.read()
     
     data = data.splitlines()
@@ -56,14 +61,141 @@ def part2(transmission: str) -> Optional[int]:
     """
     return findMarker(transmission, len_marker=14)
 
+class MarkerDetector:
+    """Sliding window marker detector over bytes fed in chunks.
+    
+    Remembers where each byte was last seen, so the window start jumps past
+    the previous occurrence of a repeated byte. Each byte costs O(1), and
+    markers of all requested lengths are found in the same pass.
+    """
+    def __init__(self, len_markers: Iterable[int]):
+        self.pending = sorted(set(len_markers))
+        self.results : Dict[int, Optional[int]] = {len_marker: None for len_marker in self.pending}
+        self.last_seen = [-1] * 256
+        self.start = 0
+        self.offset = 0
+    
+    @property
+    def done(self) -> bool:
+        return not self.pending
+    
+    def feed(self, chunk: bytes) -> bool:
+        """Consume chunk and return whether all markers were found."""
+        if (self.done):
+            return True
+        
+        last_seen = self.last_seen
+        start = self.start
+        pending = self.pending
+        
+        for pos, byte in enumerate(chunk, self.offset):
+            if (last_seen[byte] >= start):
+                start = last_seen[byte] + 1
+            last_seen[byte] = pos
+            # window grows by at most one, so shortest marker is found first
+            if (pos - start + 1 == pending[0]):
+                self.results[pending.pop(0)] = pos + 1
+                if (not pending):
+                    break
+        
+        self.start = start
+        self.offset += len(chunk)
+        return self.done
+
+def _open_input(example=0, filename='day6_input') -> BinaryIO:
+    
+    if (example):
+        return io.BytesIO(read_inputs(example).encode('utf-8'))
+    return open(filename, 'rb')
+
+def scan(f: BinaryIO, len_markers: Iterable[int], chunk_size: int = 1 << 16) -> Dict[int, Optional[int]]:
+    """Find markers in first line of stream,
+    reading no further than needed.
+    """
+    detector = MarkerDetector(len_markers)
+    
+    while (chunk := f.read(chunk_size)):
+        line_end = chunk.find(b'\n')
+        if (line_end >= 0):
+            chunk = chunk[:line_end]
+        if (detector.feed(chunk) or line_end >= 0):
+            break
+    
+    return detector.results
+
+def solve_window(example=0, filename='day6_input') -> Tuple[Optional[int], Optional[int]]:
+    
+    with _open_input(example, filename) as f:
+        results = scan(f, (4, 14))
+    
+    return results[4], results[14]
+
+def _scan_file(filename: str, len_markers: Tuple[int, ...]) -> Dict[int, Optional[int]]:
+    
+    with open(filename, 'rb') as f:
+        return scan(f, len_markers)
+
+def _scan_transmissions(transmissions: List[bytes], len_markers: Tuple[int, ...]) -> List[Dict[int, Optional[int]]]:
+    
+    results = []
+    for transmission in transmissions:
+        detector = MarkerDetector(len_markers)
+        detector.feed(transmission)
+        results.append(detector.results)
+    
+    return results
+
+def scan_batch(filenames: List[str], len_markers: Iterable[int], per_line: bool = False, workers: Optional[int] = None, batch_size: int = 1024) -> List[Tuple[str, Dict[int, Optional[int]]]]:
+    """Find markers in many transmissions using worker processes.
+    
+    Each file holds one transmission, or with per_line one transmission per
+    line. Returns (label, results) per transmission, labels are the file
+    name or file name and line number.
+    """
+    len_markers = tuple(len_markers)
+    
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        
+        if (not per_line):
+            results = pool.map(_scan_file, filenames, [len_markers] * len(filenames))
+            return list(zip(filenames, results))
+        
+        labels = []
+        batches = []
+        for filename in filenames:
+            with open(filename, 'rb') as f:
+                transmissions = f.read().splitlines()
+            labels.extend(f'{filename}:{line}' for line in range(1, len(transmissions) + 1))
+            batches.extend(transmissions[ix:ix + batch_size] for ix in range(0, len(transmissions), batch_size))
+        
+        results = pool.map(_scan_transmissions, batches, [len_markers] * len(batches))
+        return list(zip(labels, (result for batch in results for result in batch)))
+
+def install_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--engine', help='Solver engine, one of \'sets\' (default), \'window\'.', type=str, choices=['sets', 'window'], default='sets')
+    parser.add_argument('--batch', help='Scan transmission files instead of solving, one transmission per file.', type=str, nargs='+', default=None)
+    parser.add_argument('--per-line', help='Batch files hold one transmission per line.', action='store_true')
+    parser.add_argument('--markers', help='Marker lengths to find in batch mode (default: 4 14).', type=int, nargs='+', default=[4, 14])
+    parser.add_argument('--workers', help='Number of worker processes for batch mode (default: number of CPUs).', type=int, default=None)
+
 def main(args):
     
-    transmission = read_inputs(args.example)
-    payload_pos = part1(transmission)
+    if (args.batch is not None):
+        for label, results in scan_batch(args.batch, args.markers, args.per_line, args.workers):
+            logging.info(f'{label}: ' + ', '.join(f'{len_marker} at {pos}' for len_marker, pos in results.items()))
+        return
+    
+    match (args.engine):
+        case 'window':
+            payload_pos, message_pos = solve_window(args.example, args.input)
+        case _:
+            transmission = read_inputs(args.example, args.input)
+            payload_pos = part1(transmission)
+            message_pos = part2(transmission)
+    
     logging.info(f'Part 1: Payload starts at {payload_pos}')
-    message_pos = part2(transmission)
     logging.info(f'Part 2: Message starts at {message_pos}')
 
 if __name__ == '__main__':
-    args = setup()
+    args = setup(install_arguments)
     sys.exit(main(args))
@@ -6,9 +6,10 @@ import sys
 import logging
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 
-from lib import setup
+from lib import log_enabled, setup
+from lib.cache import cached_inputs
 
 example_input = """$ cd /
 $ ls
@@ -40,8 +41,13 @@ class DirEntryBase:
     name:   str
     @property
     def path(self) -> str:
-        path = '' if (self.parent is None) else self.parent.path
-        return f'{path}/{self.name}'
+        names = []
+        entry = self
+        # walk up without recursion, deep trees exceed the recursion limit
+        while (entry is not None and not isinstance(entry, Root)):
+            names.append(entry.name)
+            entry = entry.parent
+        return ''.join(f'/{name}' for name in reversed(names))
 
 @dataclass
 class DirEntryOpt:
@@ -62,19 +68,51 @@ class File(DirEntryOpt, FileBase):
 @dataclass
 class Directory(DirEntry):
     children: List[DirEntry] = field(default_factory=list)
+    # total size, None until computed or after children changed
+    _size: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
-    def iter(self) -> DirEntry:
+    def iter(self) -> Iterator[DirEntry]:
         
-        for child in self.children:
+        # depth first, children in listing order
+        stack = [iter(self.children)]
+        while (stack):
+            child = next(stack[-1], None)
+            if (child is None):
+                stack.pop()
+                continue
             
             yield child
 
             if (type(child) is Directory):
-                yield from child.iter()
+                stack.append(iter(child.children))
+    
+    def add(self, child: DirEntry):
+        """Add child and invalidate cached sizes up to the root."""
+        self.children.append(child)
+        directory = self
+        # cached sizes of ancestors depend on this one, invalid ones already are
+        while (directory is not None and directory._size is not None):
+            directory._size = None
+            directory = directory.parent
+    
+    def _compute_sizes(self):
+        """Compute sizes of all directories below in a single post-order pass,
+        skipping subtrees whose sizes are cached.
+        """
+        stack = [(self, False)]
+        while (stack):
+            directory, visited = stack.pop()
+            if (visited):
+                directory._size = sum(child.size for child in directory.children)
+                continue
+            stack.append((directory, True))
+            stack.extend((child, False) for child in directory.children if type(child) is Directory and child._size is None)
     
     @property
-    def size(self):
-        return sum(child.size for child in self.children)
+    def size(self) -> int:
+        if (self._size is None):
+            self._compute_sizes()
+        return self._size
 
 @dataclass
 class Root(Directory):
@@ -83,13 +121,14 @@ class Root(Directory):
     def path(self) -> str:
         return ''
 
-def read_inputs(example=0) -> Root:
+@cached_inputs
+def read_inputs(example=0, filename='day7_input') -> Root:
     
     match (example):
         case _ if (example):
             data = example_input
         case _:
-            with open('day7_input', 'r', encoding='utf-8') as f:
+            with open(filename, 'r', encoding='utf-8') as f:
                 data = f.read()
     
     data = data.splitlines()
@@ -115,11 +154,11 @@ def read_inputs(example=0) -> Root:
         if (line.startswith('dir')):
             directory = Directory(line[4:], cur_dir)
             directories[directory.path] = directory
-            cur_dir.children.append(directory)
+            cur_dir.add(directory)
         else:
             size, name = line.split(' ', 1)
             size = int(size)
-            cur_dir.children.append(File(name, size, cur_dir))
+            cur_dir.add(File(name, size, cur_dir))
 
     inside_ls = False
 
@@ -146,20 +185,23 @@ def read_inputs(example=0) -> Root:
 
 def printDirectories(root: Directory, indent=0) -> str:
 
-    result = f'{" "*indent}- {root.name or "/"} (dir)\n'
-    indent += 2
+    lines = []
+    # depth first, children in listing order
+    stack = [(root, indent)]
 
-    for child in root.children:
-        if (type(child) is File):
-            result += f'{" "*indent} - {child.name} (file, size={child.size})\n'
+    while (stack):
+        entry, indent = stack.pop()
+        if (type(entry) is File):
+            lines.append(f'{" "*indent} - {entry.name} (file, size={entry.size})')
         else:
-            result += printDirectories(child, indent=indent)
+            lines.append(f'{" "*indent}- {entry.name or "/"} (dir)')
+            stack.extend((child, indent + 2) for child in reversed(entry.children))
     
-    return result
+    return '\n'.join(lines) + '\n'
 
 def part1(root: Directory):
-    listing = printDirectories(root)
-    logging.debug(listing)
+    if (log_enabled(logging.DEBUG)):
+        logging.debug(printDirectories(root))
 
     candidate_directories = {dir.path: dir.size for dir in root.iter() if type(dir) is Directory and dir.size <= 100000}
 
@@ -180,7 +222,7 @@ def part2(root: Directory):
 
 def main(args):
     
-    tree = read_inputs(args.example)
+    tree = read_inputs(args.example, args.input)
     candidate_directories = part1(tree)
     logging.info(f'Part 1: Candidate Directories {", ".join(candidate_directories)} Sum {sum(candidate_directories.values())}')
     path, size = part2(tree)
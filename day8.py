@@ -8,7 +8,8 @@ from dataclasses import dataclass, field
 from math import prod
 from typing import Dict, List, Optional, Tuple
 
-from lib import setup
+from lib import log_enabled, setup
+from lib.cache import cached_inputs
 
 example_input = """30373
 25512
@@ -23,13 +24,14 @@ class Grid:
     height: int
     data : List[List[int]] = field(default_factory=list)
 
-def read_inputs(example=0) -> List[List[int]]:
+@cached_inputs
+def read_inputs(example=0, filename='day8_input') -> List[List[int]]:
     
     match (example):
         case _ if (example):
             data = example_input
         case _:
-            with open('day8_input', 'r', encoding='utf-8') as f:
+            with open(filename, 'r', encoding='utf-8') as f:
                 data = f.read()
     
     data = data.splitlines()
@@ -57,6 +59,7 @@ def _makeBitmap(grid: Grid, level: int):
 def part1(grid: Grid) -> int:
     
     visible_trees = 0
+    debug = log_enabled(logging.DEBUG)
     
     # make grids for heights 0 thru 9
     bitmaps = {lvl: _makeBitmap(grid, lvl) for lvl in range(0, 10)}
@@ -81,7 +84,8 @@ def part1(grid: Grid) -> int:
                 if not any(bitmap[h][dw] for dw in range(0, w)) or not any(bitmap[h][dw] for dw in range(w + 1, grid.width)):
                     visible = True
                 
-                logging.debug(f'Tree {height} @{w},{h} is {"not " if not visible else ""}visible')
+                if (debug):
+                    logging.debug(f'Tree {height} @{w},{h} is {"not " if not visible else ""}visible')
                 
                 if visible:
                     visible_trees += 1
@@ -170,7 +174,7 @@ def part2(grid: Grid) -> Tuple[int, int, int]:
 
 def main(args):
     
-    grid = read_inputs(args.example)
+    grid = read_inputs(args.example, args.input)
     visible_trees = part1(grid)
     logging.info(f'Part 1: {visible_trees} trees are visible')
     x, y, score, value = part2(grid)
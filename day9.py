@@ -9,7 +9,9 @@ from enum import StrEnum
 from math import copysign
 from typing import Dict, List, Optional, Tuple
 
-from lib import setup
+from lib import log_enabled, setup
+from lib.cache import cached_inputs
+from lib.render import Canvas, clip
 
 example1_input = """R 4
 U 4
@@ -84,7 +86,8 @@ class Command:
     dir:    Direction
     steps : int
 
-def read_inputs(example=0) -> Tuple[Rect, List[Command]]:
+@cached_inputs
+def read_inputs(example=0, filename='day9_input') -> Tuple[Rect, List[Command]]:
     
     match (example):
         case 1:
@@ -92,7 +95,7 @@ def read_inputs(example=0) -> Tuple[Rect, List[Command]]:
         case _ if (example):
             data = example2_input
         case _:
-            with open('day9_input', 'r', encoding='utf-8') as f:
+            with open(filename, 'r', encoding='utf-8') as f:
                 data = f.read()
     
     data = data.splitlines()
@@ -124,29 +127,28 @@ def read_inputs(example=0) -> Tuple[Rect, List[Command]]:
 
 def drawField(field: Rect, head: Optional[Point], tail: Optional[Point], tails: List[Point] = [], visited: List[Point] = []):
     
-    diagram = [['.' for _ in range(field.w)] for _ in range(field.h)]
+    canvas = Canvas(clip(field.x, field.y, field.w, field.h), background='.', y_up=True)
     
     # draw visited
     for point in visited:
-        diagram[point.y-field.y][point.x-field.x] = '#'
+        canvas.put(point.x, point.y, '#')
     
     # draw origin
-    diagram[0-field.y][0-field.x] = 's'
+    canvas.put(0, 0, 's')
     
     # draw tail
     if (tail is not None):
-        diagram[tail.y-field.y][tail.x-field.x] = 'T'
+        canvas.put(tail.x, tail.y, 'T')
     
     # draw tails
     for num, tail in reversed(list(enumerate(tails, 1))):
-        diagram[tail.y-field.y][tail.x-field.x] = str(num)
+        canvas.put(tail.x, tail.y, str(num))
     
     # draw head
     if (head is not None):
-        diagram[head.y-field.y][head.x-field.x] = 'H'
+        canvas.put(head.x, head.y, 'H')
     
-    diagram_str = '\n'.join(''.join(diagram[h]) for h in range(field.h -1, -1, -1))
-    logging.info(diagram_str)
+    logging.info(canvas.render())
 
 def part1(field: Rect, commands: List[Command]) -> int:
     
@@ -174,7 +176,8 @@ def part1(field: Rect, commands: List[Command]) -> int:
             visited.add((tail.x, tail.y))
             #drawField(field, head, tail)
     
-    drawField(field, None, None, visited=[Point(x, y) for x, y in visited])
+    if (log_enabled(logging.INFO)):
+        drawField(field, None, None, visited=[Point(x, y) for x, y in visited])
     
     return len(visited)
 
@@ -206,13 +209,14 @@ def part2(field: Rect, commands: List[Command]) -> int:
             visited.add((tail.x, tail.y))
             #drawField(field, head, None, tails=tails)
     
-    drawField(field, None, None, visited=[Point(x, y) for x, y in visited])
+    if (log_enabled(logging.INFO)):
+        drawField(field, None, None, visited=[Point(x, y) for x, y in visited])
     
     return len(visited)
 
 def main(args):
     
-    field, commands = read_inputs(args.example)
+    field, commands = read_inputs(args.example, args.input)
     num_points = part1(field, commands)
     logging.info(f'Part 1: There were {num_points} unique points visited by Tail')
     num_points = part2(field, commands)
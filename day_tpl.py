@@ -7,17 +7,19 @@ import logging
 from typing import Dict, List, Optional, Tuple
 
 from lib import setup
+from lib.cache import cached_inputs
 
 example_input = """
 """
 
-def read_inputs(example=0):
+@cached_inputs
+def read_inputs(example=0, filename='dayN_input'):
     
     match (example):
         case _ if (example):
             data = example_input
         case _:
-            with open('dayN_input', 'r', encoding='utf-8') as f:
+            with open(filename, 'r', encoding='utf-8') as f:
                 data = f.read()
     
     data = data.splitlines()
@@ -33,7 +35,7 @@ def part2():
 
 def main(args):
     
-    read_inputs(args.example)
+    read_inputs(args.example, args.input)
     part1()
     logging.info(f'Part 1: ')
     part2()
@@ -2,23 +2,66 @@
 # -*- coding: utf-8 -*-
 
 import argparse
+import atexit
 import logging
+import logging.handlers
+import queue
+import re
 import sys
 
-from typing import Callable
+from pathlib import Path
+
+from typing import Callable, Optional
 
 __all__ = [
     'MultiLineFormatter',
+    'DeferredQueueHandler',
+    'log_enabled',
+    'parse_loglevel',
     'setup',
 ]
 
 class MultiLineFormatter(logging.Formatter):
     def format(self, record):
         str = logging.Formatter.format(self, record)
-        header, footer = str.split(record.message)
-        str = str.replace('\n', '\n' + ' '*len(header))
+        if ('\n' not in str):
+            return str
+        header = str.find(record.message)
+        str = str.replace('\n', '\n' + ' '*max(header, 0))
         return str
 
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue handler that leaves formatting to the listener thread.
+    Records are only passed within the process, so they need not be
+    made picklable by formatting them up front.
+    """
+    def prepare(self, record):
+        return record
+
+def log_enabled(level: int = logging.INFO) -> bool:
+    """Check whether messages of level would be logged.
+    Use to skip building expensive messages in hot loops.
+    """
+    return logging.getLogger().isEnabledFor(level)
+
+LOGLEVEL_MAP = {
+    'debug':   logging.DEBUG,
+    'info':    logging.INFO,
+    'warning': logging.WARNING,
+    'error':   logging.ERROR,
+    }
+
+def parse_loglevel(name: str) -> Optional[int]:
+    return LOGLEVEL_MAP.get(name.lower(), None)
+
+def _main_day() -> Optional[str]:
+    # name of calling dayN script, if any
+    path = getattr(sys.modules['__main__'], '__file__', None)
+    if (path is None):
+        return None
+    name = Path(path).stem
+    return name if (re.fullmatch(r'day\d+', name)) else None
+
 def setup(install_arguments: Callable[[argparse.ArgumentParser], None] = None) -> argparse.Namespace:
     # Set up Logger
     l = logging.getLogger()
@@ -27,17 +70,24 @@ def setup(install_arguments: Callable[[argparse.ArgumentParser], None] = None) -
     l.addHandler(h)
     l.setLevel(logging.INFO)
 
-    logLevelMap = {
-        'debug':   logging.DEBUG,
-        'info':    logging.INFO,
-        'warning': logging.WARNING,
-        'error':   logging.ERROR,
-        }
-    
     # Parse command line arguments
+    day = _main_day()
     parser = argparse.ArgumentParser(description='Advent of Code.', formatter_class=argparse.RawTextHelpFormatter)
     parser.add_argument('--loglevel', help='Loglevel, one of \'DEBUG\', \'INFO\' (default), \'WARNING\', \'ERROR\'.', type=str, default='INFO')
+    parser.add_argument('--log-async', help='Format and write log messages in a background thread.', action='store_true')
+    parser.add_argument('--frame-every', help='Only draw every Nth frame of visualizations (default: 1).', type=int, default=1)
+    parser.add_argument('--frame-fps', help='Draw at most K frames of visualizations per second.', type=float, default=None)
+    parser.add_argument('--viewport', help='Clip visualizations to WxH characters.', type=str, default=None)
+    parser.add_argument('--cache', help='Cache parsed inputs on disk.', action='store_true')
+    parser.add_argument('--cache-dir', help='Cache directory (default: \'.cache\' in repository).', type=str, default=None)
+    parser.add_argument('--cache-size', help='Size limit per cache in MiB (default: 256).', type=int, default=256)
     parser.add_argument('--example', help='Use example data.', type=int, choices=range(1,10+1), default=0)
+    parser.add_argument('--input', help='Read input from file (default: \'dayN_input\').', type=str, default=f'{day}_input' if (day is not None) else None)
+    parser.add_argument('--scale', help='Use generated input with approximately N records instead.', type=int, default=None)
+    parser.add_argument('--seed', help='Random seed for generated input (default: 0).', type=int, default=0)
+    parser.add_argument('--profile', help='Profile parsing and each part, one of \'cpu\' (cProfile), \'mem\' (tracemalloc).', type=str, choices=['cpu', 'mem'], default=None)
+    parser.add_argument('--profile-dir', help='Directory for profile dumps (default: \'.\').', type=str, default='.')
+    parser.add_argument('--profile-top', help='Number of entries in profile summaries (default: 10).', type=int, default=10)
     if (install_arguments is not None):
         install_arguments(parser)
 
@@ -49,10 +99,51 @@ def setup(install_arguments: Callable[[argparse.ArgumentParser], None] = None) -
         sys.exit(-1)
     
     # Set User Loglevel
-    logLevel = logLevelMap.get(args.loglevel.lower(), None)
+    logLevel = parse_loglevel(args.loglevel)
     if (logLevel is None):
         logging.error('Invalid loglevel \'{0:s}\' passed. Exiting...'.format(args.loglevel))
         sys.exit(-1)
     
     l.setLevel(logLevel)
+    
+    # Move output to listener thread
+    if (args.log_async):
+        q = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(q, h, respect_handler_level=True)
+        l.removeHandler(h)
+        l.addHandler(DeferredQueueHandler(q))
+        listener.start()
+        atexit.register(listener.stop)
+    
+    # Configure visualizations
+    if (args.frame_every != 1 or args.frame_fps is not None or args.viewport is not None):
+        from lib import render
+        max_size = None
+        if (args.viewport is not None):
+            m = re.fullmatch(r'(\d+)x(\d+)', args.viewport)
+            if (m is None):
+                logging.error('Invalid viewport \'{0:s}\' passed. Exiting...'.format(args.viewport))
+                sys.exit(-1)
+            max_size = (int(m.group(1)), int(m.group(2)))
+        render.configure(args.frame_every, args.frame_fps, max_size)
+    
+    # Configure caches
+    if (args.cache):
+        from lib import cache
+        cache.configure(True, args.cache_dir, args.cache_size * 1024 * 1024)
+    
+    # Generate scaled input
+    if (args.scale is not None):
+        if (day is None):
+            logging.error('Generated input is only available for dayN scripts. Exiting...')
+            sys.exit(-1)
+        from lib import generators
+        args.input = generators.write_temporary(generators.generate(day, args.scale, args.seed), day)
+        logging.info(f'Generated input with scale {args.scale} (seed {args.seed}) in {args.input}')
+    
+    # Wrap solver phases of calling script
+    if (args.profile is not None):
+        from lib import profiling
+        profiling.install(sys.modules['__main__'], args.profile, args.profile_dir, args.profile_top)
+    
     return args
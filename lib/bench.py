@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+from dataclasses import asdict, dataclass
+from statistics import mean, median
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from lib import parse_loglevel, setup
+from lib.days import PARTS, ROOT, arguments, discover, load
+
+__all__ = [
+    'Stats',
+    'measure',
+    'bench_day',
+    'bench_all',
+    'compare',
+]
+
+@dataclass
+class Stats:
+    runs:   int
+    min:    float
+    median: float
+    p95:    float
+    mean:   float
+
+    @staticmethod
+    def fromTimings(timings: List[float]) -> 'Stats':
+        ordered = sorted(timings)
+        # nearest-rank percentile
+        p95 = ordered[max(0, -(-95 * len(ordered) // 100) - 1)]
+        return Stats(len(ordered), ordered[0], median(ordered), p95, mean(ordered))
+
+def measure(func: Callable[..., Any], prepare: Callable[[], Tuple[Any, ...]], repeat: int = 5, warmup: int = 1) -> Stats:
+    """Time func over repeat runs after warmup runs.
+    Arguments are produced by prepare before each run
+    and are not part of the measurement.
+    """
+    timings = []
+
+    for run in range(warmup + repeat):
+        args = prepare()
+        start = time.perf_counter()
+        func(*args)
+        elapsed = time.perf_counter() - start
+        if (run >= warmup):
+            timings.append(elapsed)
+
+    return Stats.fromTimings(timings)
+
+def bench_day(day: str, repeat: int = 5, warmup: int = 1) -> Dict[str, Stats]:
+    """Benchmark read_inputs, part1 and part2 of a day separately."""
+    module = load(day)
+    inputs = module.read_inputs()
+    results = {'read_inputs': measure(module.read_inputs, lambda: (), repeat, warmup)}
+
+    for part in PARTS:
+        results[part] = measure(getattr(module, part), lambda: arguments(module, part, inputs), repeat, warmup)
+
+    return results
+
+def bench_all(days: Optional[List[str]] = None, repeat: int = 5, warmup: int = 1, loglevel: int = logging.WARNING) -> Dict[str, Dict[str, Stats]]:
+    """Benchmark all days with logging at loglevel
+    so that log output of the days is not measured.
+    """
+    if (days is None):
+        days = discover()
+
+    l = logging.getLogger()
+    user_level = l.level
+    results = {}
+
+    for day in days:
+        logging.info(f'Benchmarking {day}...')
+        l.setLevel(loglevel)
+        try:
+            results[day] = bench_day(day, repeat, warmup)
+        finally:
+            l.setLevel(user_level)
+
+    return results
+
+def compare(current: Dict[str, Dict[str, Dict[str, float]]], baseline: Dict[str, Dict[str, Dict[str, float]]], threshold: float = 0.1, floor: float = 0.001) -> List[str]:
+    """Compare median timings against baseline
+    and return a description of each regression.
+
+    A phase regresses if it is slower than the baseline by more than
+    threshold (relative) and floor (absolute seconds). The absolute
+    floor keeps sub-millisecond phases from flagging on timer noise.
+    """
+    regressions = []
+
+    for day, phases in current.items():
+        for phase, stats in phases.items():
+            base = baseline.get(day, {}).get(phase, None)
+            if (base is None):
+                continue
+            delta = stats['median'] - base['median']
+            if (delta > floor and delta > threshold * base['median']):
+                regressions.append(f'{day} {phase}: median {stats["median"]:.6f}s vs. baseline {base["median"]:.6f}s (+{100 * delta / base["median"]:.1f}%)')
+
+    return regressions
+
+def _format_table(results: Dict[str, Dict[str, Stats]]) -> str:
+
+    lines = [f'{"Day":<6} {"Phase":<12} {"Min":>10} {"Median":>10} {"P95":>10}']
+
+    for day, phases in results.items():
+        for phase, stats in phases.items():
+            lines.append(f'{day:<6} {phase:<12} {stats.min:>9.6f}s {stats.median:>9.6f}s {stats.p95:>9.6f}s')
+
+    return '\n'.join(lines)
+
+def install_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('days', help='Days to benchmark, e.g. \'day1\' or \'1\' (default: all).', nargs='*')
+    parser.add_argument('--repeat', help='Number of timed runs per phase (default: 5).', type=int, default=5)
+    parser.add_argument('--warmup', help='Number of untimed runs per phase (default: 1).', type=int, default=1)
+    parser.add_argument('--output', help='Write results as JSON to file.', type=str, default=None)
+    parser.add_argument('--baseline', help='Compare results against JSON baseline file.', type=str, default=None)
+    parser.add_argument('--threshold', help='Relative slowdown tolerated against baseline (default: 0.1).', type=float, default=0.1)
+    parser.add_argument('--floor', help='Absolute slowdown in seconds tolerated against baseline (default: 0.001).', type=float, default=0.001)
+    parser.add_argument('--bench-loglevel', help='Loglevel while measuring (default: \'WARNING\').', type=str, default='WARNING')
+
+def main(args):
+
+    days = [day if (not day.isdigit()) else f'day{day}' for day in args.days] or None
+    loglevel = parse_loglevel(args.bench_loglevel)
+    if (loglevel is None):
+        logging.error(f'Invalid bench loglevel \'{args.bench_loglevel}\' passed. Exiting...')
+        return -1
+
+    # days read their inputs relative to the repository root
+    os.chdir(ROOT)
+    results = bench_all(days, args.repeat, args.warmup, loglevel)
+    logging.info(f'Results\n{_format_table(results)}')
+    current = {day: {phase: asdict(stats) for phase, stats in phases.items()} for day, phases in results.items()}
+
+    if (args.output is not None):
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(current, f, indent=2)
+
+    if (args.baseline is not None):
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold, args.floor)
+        for regression in regressions:
+            logging.error(f'Regression {regression}')
+        if (regressions):
+            return 1
+        logging.info(f'No regressions against baseline {args.baseline}')
+
+    return 0
+
+if __name__ == '__main__':
+    args = setup(install_arguments)
+    sys.exit(main(args))
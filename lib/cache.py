@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import pickle
+import tempfile
+
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Optional
+
+__all__ = [
+    'configure',
+    'settings',
+    'enabled',
+    'file_digest',
+    'source_digest',
+    'load',
+    'store',
+    'evict',
+    'cached_inputs',
+    'answer_key',
+]
+
+# settings for all caches, set from command line by lib.setup
+_enabled : bool = False
+_directory : Path = Path(__file__).resolve().parent.parent / '.cache'
+_max_bytes : int = 256 * 1024 * 1024
+
+def configure(enabled: bool = True, directory: Optional[str] = None, max_bytes: Optional[int] = None):
+    """Enable or disable caching and set location and size limit."""
+    global _enabled, _directory, _max_bytes
+    _enabled = enabled
+    if (directory is not None):
+        _directory = Path(directory)
+    if (max_bytes is not None):
+        _max_bytes = max_bytes
+
+def settings() -> Dict[str, Any]:
+    """Current settings as keyword arguments to configure,
+    e.g. to pass them on to worker processes.
+    """
+    return {'enabled': _enabled, 'directory': str(_directory), 'max_bytes': _max_bytes}
+
+def enabled() -> bool:
+    return _enabled
+
+def directory(kind: str) -> Path:
+    return _directory / kind
+
+@functools.lru_cache(maxsize=None)
+def _file_digest(path: str, mtime_ns: int, size: int) -> str:
+    with open(path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+def file_digest(path: str) -> str:
+    """SHA-256 of file contents, remembered per path, size and modification time."""
+    st = os.stat(path)
+    return _file_digest(os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+def source_digest(obj: Any) -> str:
+    """SHA-256 of the source file defining obj."""
+    return file_digest(inspect.getsourcefile(obj))
+
+def load(kind: str, key: str) -> Any:
+    """Load entry from cache, raises KeyError if there is none."""
+    path = directory(kind) / f'{key}.pickle'
+    try:
+        with open(path, 'rb') as f:
+            value = pickle.load(f)
+    except FileNotFoundError:
+        raise KeyError(key)
+    except Exception as e:
+        logging.warning(f'Discarding unreadable cache entry {path}: {e}')
+        path.unlink(missing_ok=True)
+        raise KeyError(key)
+    # mark as recently used
+    os.utime(path)
+    return value
+
+def store(kind: str, key: str, value: Any):
+    """Store entry in cache and evict least recently used entries."""
+    path = directory(kind)
+    path.mkdir(parents=True, exist_ok=True)
+    # write atomically, concurrent runs may race for the same entry
+    fd, tmp = tempfile.mkstemp(dir=path, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path / f'{key}.pickle')
+    except BaseException:
+        os.remove(tmp)
+        raise
+    evict(kind)
+
+def evict(kind: str, max_bytes: Optional[int] = None):
+    """Remove least recently used entries until the cache fits max_bytes."""
+    max_bytes = _max_bytes if (max_bytes is None) else max_bytes
+    entries = []
+
+    for entry in os.scandir(directory(kind)):
+        if (entry.name.endswith('.pickle')):
+            st = entry.stat()
+            entries.append((st.st_mtime_ns, st.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if (total <= max_bytes):
+            break
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        total -= size
+
+def cached_inputs(read_inputs: Callable[..., Any]) -> Callable[..., Any]:
+    """Cache parsed inputs of read_inputs(example, filename) on disk.
+
+    Entries are keyed on the input file's digest and the digest of the
+    module defining read_inputs, so changes to the parser or to the classes
+    it creates invalidate them. Example inputs are never cached.
+    """
+    signature = inspect.signature(read_inputs)
+
+    @functools.wraps(read_inputs)
+    def wrapper(*args, **kwargs):
+
+        if (not _enabled):
+            return read_inputs(*args, **kwargs)
+
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        if (bound.arguments['example']):
+            return read_inputs(*args, **kwargs)
+
+        key = hashlib.sha256(':'.join([
+            read_inputs.__module__,
+            source_digest(read_inputs),
+            file_digest(bound.arguments['filename']),
+            ]).encode('utf-8')).hexdigest()
+
+        try:
+            return load('inputs', key)
+        except KeyError:
+            pass
+
+        inputs = read_inputs(*args, **kwargs)
+        # failing to cache must never fail the solve
+        try:
+            store('inputs', key, inputs)
+        except Exception as e:
+            logging.warning(f'Could not cache inputs of {read_inputs.__module__}: {type(e).__name__}: {e}')
+        return inputs
+
+    return wrapper
+
+def answer_key(module: ModuleType, part: str, filename: str) -> str:
+    """Key for the answer of part of module on input filename.
+    Any change to the module's source invalidates its answers.
+    """
+    return hashlib.sha256(':'.join([
+        module.__name__,
+        part,
+        source_digest(module),
+        file_digest(filename),
+        ]).encode('utf-8')).hexdigest()
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+from dataclasses import dataclass, field
+from math import log
+from typing import Callable, Dict, List, Optional, Tuple
+
+from lib import parse_loglevel, setup
+from lib.bench import measure
+from lib.days import PARTS, ROOT, arguments, discover, load
+from lib.generators import GENERATORS, generate, write_temporary
+
+__all__ = [
+    'MODELS',
+    'Fit',
+    'fit',
+    'check_day',
+]
+
+MODELS : Dict[str, Callable[[float], float]] = {
+    'O(n)':       lambda n: n,
+    'O(n log n)': lambda n: n * log(n),
+    'O(n^2)':     lambda n: n ** 2,
+    'O(n^3)':     lambda n: n ** 3,
+}
+
+# timings below this are dominated by timer resolution and call overhead
+RESOLUTION = 1e-5
+
+@dataclass
+class Fit:
+    exponent: float
+    model:    str
+    sizes:    List[int] = field(default_factory=list)
+    timings:  List[float] = field(default_factory=list)
+
+def _least_squares(xs: List[float], ys: List[float]) -> Tuple[float, float]:
+
+    mx = sum(xs) / len(xs)
+    my = sum(ys) / len(ys)
+    sxx = sum((x - mx) ** 2 for x in xs)
+    slope = sum((x - mx) * (y - my) for x, y in zip(xs, ys)) / sxx
+    return slope, my - slope * mx
+
+def fit(sizes: List[int], timings: List[float]) -> Optional[Fit]:
+    """Fit timings against sizes.
+
+    The empirical exponent is the slope of log(t) over log(n). The model is
+    the one of MODELS whose scaled log curve has the smallest squared error.
+    Returns None if there are too few timings above timer resolution.
+    """
+    points = [(n, t) for n, t in zip(sizes, timings) if t >= RESOLUTION]
+    if (len(points) < 2 or len(set(n for n, _ in points)) < 2):
+        return None
+
+    log_n = [log(n) for n, _ in points]
+    log_t = [log(t) for _, t in points]
+    exponent, _ = _least_squares(log_n, log_t)
+
+    errors = {}
+    for name, model in MODELS.items():
+        # log(t) = log(c) + log(f(n)), log(c) fitted as mean difference
+        diffs = [lt - log(model(n)) for (n, _), lt in zip(points, log_t)]
+        offset = sum(diffs) / len(diffs)
+        errors[name] = sum((d - offset) ** 2 for d in diffs)
+
+    return Fit(exponent, min(errors, key=errors.get), [n for n, _ in points], [t for _, t in points])
+
+def check_day(day: str, sizes: List[int], repeat: int = 3, budget: float = 10.0, seed: int = 0) -> Tuple[Dict[str, Optional[Fit]], List[int]]:
+    """Time parsing and both parts of day on generated inputs of increasing size.
+    Sizes are skipped once a phase needed more than budget seconds.
+    Returns fits per phase and the sizes that were measured.
+    """
+    module = load(day)
+    phases = ('read_inputs',) + PARTS
+    timings : Dict[str, List[float]] = {phase: [] for phase in phases}
+    measured : List[int] = []
+
+    for size in sizes:
+        path = write_temporary(generate(day, size, seed), day)
+        inputs = module.read_inputs(filename=path)
+        timings['read_inputs'].append(measure(module.read_inputs, lambda: (0, path), repeat, 0).min)
+        for part in PARTS:
+            timings[part].append(measure(getattr(module, part), lambda: arguments(module, part, inputs), repeat, 0).min)
+        os.remove(path)
+        measured.append(size)
+        logging.info(f'{day} size {size}: ' + ', '.join(f'{phase} {timings[phase][-1]:.6f}s' for phase in phases))
+
+        if (max(timings[phase][-1] for phase in phases) > budget):
+            break
+
+    return {phase: fit(measured, timings[phase]) for phase in phases}, measured
+
+def install_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('days', help='Days to check, e.g. \'day1\' or \'1\' (default: all).', nargs='*')
+    parser.add_argument('--start', help='Smallest input size (default: 250).', type=int, default=250)
+    parser.add_argument('--factor', help='Growth factor between sizes (default: 2).', type=float, default=2.0)
+    parser.add_argument('--steps', help='Number of sizes (default: 6).', type=int, default=6)
+    parser.add_argument('--repeat', help='Timed runs per size, minimum is used (default: 3).', type=int, default=3)
+    parser.add_argument('--budget', help='Stop growing once a phase takes longer than this many seconds (default: 10).', type=float, default=10.0)
+    parser.add_argument('--limits', help='JSON file with maximum exponents, e.g. {"day6": {"part1": 1.2}}.', type=str, default=None)
+    parser.add_argument('--check-loglevel', help='Loglevel while measuring (default: \'WARNING\').', type=str, default='WARNING')
+
+def main(args):
+
+    days = [day if (not day.isdigit()) else f'day{day}' for day in args.days] or [day for day in discover() if day in GENERATORS]
+    sizes = sorted(set(int(args.start * args.factor ** i) for i in range(args.steps)))
+    loglevel = parse_loglevel(args.check_loglevel)
+    if (loglevel is None):
+        logging.error(f'Invalid check loglevel \'{args.check_loglevel}\' passed. Exiting...')
+        return -1
+
+    limits = {}
+    if (args.limits is not None):
+        with open(args.limits, 'r', encoding='utf-8') as f:
+            limits = json.load(f)
+
+    os.chdir(ROOT)
+    l = logging.getLogger()
+    user_level = l.level
+    lines = [f'{"Day":<6} {"Phase":<12} {"Exponent":>8}  Model']
+    violations = []
+    warnings = []
+
+    for day in days:
+        logging.info(f'Checking {day} at sizes {", ".join(str(size) for size in sizes)}...')
+        l.setLevel(loglevel)
+        try:
+            fits, measured = check_day(day, sizes, args.repeat, args.budget, args.seed)
+        finally:
+            l.setLevel(user_level)
+
+        for phase, result in fits.items():
+            limit = limits.get(day, {}).get(phase, None)
+            if (result is None):
+                if (len(measured) < 2):
+                    reason = f'budget exceeded after {len(measured)} size{"s" if (len(measured) != 1) else ""}'
+                    if (limit is not None):
+                        violations.append(f'{day} {phase}: {reason}, cannot check limit {limit:.2f}')
+                else:
+                    reason = 'too fast to measure'
+                    if (limit is not None):
+                        warnings.append(f'{day} {phase}: {reason}, limit {limit:.2f} not checked')
+                lines.append(f'{day:<6} {phase:<12} {"n/a":>8}  {reason}')
+                continue
+            lines.append(f'{day:<6} {phase:<12} {result.exponent:>8.2f}  {result.model}')
+            if (limit is not None and result.exponent > limit):
+                violations.append(f'{day} {phase}: exponent {result.exponent:.2f} exceeds limit {limit:.2f}')
+
+    logging.info(f'Results\n' + '\n'.join(lines))
+    for warning in warnings:
+        logging.warning(f'Complexity {warning}')
+    for violation in violations:
+        logging.error(f'Complexity {violation}')
+
+    return 1 if (violations) else 0
+
+if __name__ == '__main__':
+    args = setup(install_arguments)
+    sys.exit(main(args))
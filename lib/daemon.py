@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+
+from lib import parse_loglevel, setup
+from lib.days import PARTS, ROOT, discover, load, solve
+
+__all__ = [
+    'DEFAULT_SOCKET',
+    'SolverCache',
+    'serve',
+    'request',
+]
+
+DEFAULT_SOCKET = os.path.join(tempfile.gettempdir(), 'aoc-solver.sock')
+
+class SolverCache:
+    """Imported day modules with parsed inputs and answers.
+    Entries are keyed on the input file's path, size and modification time,
+    so edited inputs are parsed again. Safe to share between threads,
+    parsing and solving happen one at a time.
+    """
+    def __init__(self, days: List[str]):
+        self.modules : Dict[str, ModuleType] = {day: load(day) for day in days}
+        self.inputs : Dict[Tuple, Any] = {}
+        self.answers : Dict[Tuple, Any] = {}
+        self.lock = threading.RLock()
+
+    def _key(self, day: str, path: str) -> Tuple:
+        st = os.stat(path)
+        return (day, os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+    def preload(self):
+        for day in self.modules:
+            path = f'{day}_input'
+            if (os.path.exists(path)):
+                self.parse(day, path)
+
+    def parse(self, day: str, path: str) -> Tuple[Any, float, bool]:
+
+        key = self._key(day, path)
+        with self.lock:
+            if (key in self.inputs):
+                return self.inputs[key], 0.0, True
+
+            start = time.perf_counter()
+            inputs = self.modules[day].read_inputs(filename=path)
+            elapsed = time.perf_counter() - start
+            self.inputs[key] = inputs
+            return inputs, elapsed, False
+
+    def solve(self, day: str, part: str, path: Optional[str] = None) -> Dict[str, Any]:
+
+        if (day.isdigit()):
+            day = f'day{day}'
+        if (day not in self.modules):
+            raise ValueError(f'Unknown day \'{day}\'')
+        if (part.isdigit()):
+            part = f'part{part}'
+        if (part not in PARTS):
+            raise ValueError(f'Unknown part \'{part}\'')
+        path = path or f'{day}_input'
+
+        key = self._key(day, path) + (part,)
+        with self.lock:
+            if (key in self.answers):
+                return {'day': day, 'part': part, 'answer': self.answers[key], 'parse': 0.0, 'solve': 0.0, 'cached': True}
+
+            inputs, parse_time, _ = self.parse(day, path)
+            start = time.perf_counter()
+            answer = str(solve(self.modules[day], part, inputs))
+            solve_time = time.perf_counter() - start
+            self.answers[key] = answer
+            return {'day': day, 'part': part, 'answer': answer, 'parse': parse_time, 'solve': solve_time, 'cached': False}
+
+class SolverHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+
+        for line in self.rfile:
+            start = time.perf_counter()
+            match (line.decode('utf-8').split()):
+                case ['ping']:
+                    response = {'pong': True}
+                case ['solve', day, part]:
+                    response = self._solve(day, part)
+                case ['solve', day, part, path]:
+                    response = self._solve(day, part, path)
+                case _:
+                    response = {'error': f'Invalid request \'{line.decode("utf-8").strip()}\''}
+            response['latency'] = time.perf_counter() - start
+            self.wfile.write(json.dumps(response).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+    def _solve(self, day: str, part: str, path: Optional[str] = None) -> Dict[str, Any]:
+        try:
+            return self.server.cache.solve(day, part, path)
+        except Exception as e:
+            return {'error': f'{type(e).__name__}: {e}'}
+
+class SolverServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serve each connection in its own thread,
+    so idle clients do not block others.
+    """
+    daemon_threads = True
+
+    def __init__(self, path: str, cache: SolverCache):
+        self.cache = cache
+        super().__init__(path, SolverHandler)
+
+def serve(path: str = DEFAULT_SOCKET, days: Optional[List[str]] = None):
+    """Preload days and their inputs and answer requests on Unix socket path
+    until interrupted. Requests are lines of the form 'solve DAY PART [INPUT]'.
+    """
+    # days read their inputs relative to the repository root
+    os.chdir(ROOT)
+    cache = SolverCache(days or discover())
+    start = time.perf_counter()
+    cache.preload()
+    logging.warning(f'Preloaded {len(cache.modules)} days in {time.perf_counter() - start:.3f}s')
+
+    if (os.path.exists(path)):
+        os.remove(path)
+
+    with SolverServer(path, cache) as server:
+        logging.warning(f'Listening on {path}')
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.remove(path)
+
+def request(command: str, path: str = DEFAULT_SOCKET) -> Dict[str, Any]:
+    """Send a single request to the solver daemon and return its response."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(path)
+        s.sendall(command.encode('utf-8') + b'\n')
+        s.shutdown(socket.SHUT_WR)
+        with s.makefile('rb') as f:
+            return json.loads(f.readline())
+
+def install_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('--socket', help=f'Unix socket path (default: \'{DEFAULT_SOCKET}\').', type=str, default=DEFAULT_SOCKET)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    serve_parser = subparsers.add_parser('serve', help='Run solver daemon.')
+    serve_parser.add_argument('days', help='Days to preload (default: all).', nargs='*')
+    serve_parser.add_argument('--solver-loglevel', help='Loglevel while solving (default: \'WARNING\').', type=str, default='WARNING')
+    solve_parser = subparsers.add_parser('solve', help='Request answer from solver daemon.')
+    solve_parser.add_argument('day', help='Day, e.g. \'day1\' or \'1\'.', type=str)
+    solve_parser.add_argument('part', help='Part, e.g. \'part1\' or \'1\'.', type=str)
+    solve_parser.add_argument('input', help='Input file (default: \'dayN_input\').', type=str, nargs='?', default=None)
+
+def main(args):
+
+    match (args.command):
+        case 'serve':
+            loglevel = parse_loglevel(args.solver_loglevel)
+            if (loglevel is None):
+                logging.error(f'Invalid solver loglevel \'{args.solver_loglevel}\' passed. Exiting...')
+                return -1
+            logging.getLogger().setLevel(loglevel)
+            days = [day if (not day.isdigit()) else f'day{day}' for day in args.days] or None
+            serve(args.socket, days)
+        case 'solve':
+            command = f'solve {args.day} {args.part}'
+            if (args.input is not None):
+                # daemon resolves paths relative to the repository root
+                command += f' {os.path.abspath(args.input)}'
+            response = request(command, args.socket)
+            if ('error' in response):
+                logging.error(response['error'])
+                return 1
+            logging.info(f'{response["day"]} {response["part"]}: {response["answer"]} '
+                         f'(parse {response["parse"]:.6f}s, solve {response["solve"]:.6f}s, '
+                         f'{"cached" if response["cached"] else "computed"}, latency {response["latency"]:.6f}s)')
+
+    return 0
+
+if __name__ == '__main__':
+    args = setup(install_arguments)
+    sys.exit(main(args))
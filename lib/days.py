@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import importlib
+import inspect
+import re
+
+from copy import deepcopy
+from pathlib import Path
+from types import ModuleType
+from typing import Any, List, Optional, Tuple
+
+__all__ = [
+    'ROOT',
+    'PARTS',
+    'discover',
+    'arguments',
+    'input_file',
+    'load',
+    'solve',
+]
+
+# repository root, i.e. where the dayN.py scripts and their inputs live
+ROOT = Path(__file__).resolve().parent.parent
+
+PARTS = ('part1', 'part2')
+
+DAY_PATTERN = re.compile(r'^day(\d+)\.py$')
+
+def discover(root: Optional[Path] = None) -> List[str]:
+    """Find all dayN modules in root
+    and return their names in day order.
+    """
+    root = ROOT if (root is None) else Path(root)
+    days = []
+
+    for path in root.iterdir():
+        m = DAY_PATTERN.match(path.name)
+        if (m is None):
+            continue
+        days.append((int(m.group(1)), path.stem))
+
+    return [name for _, name in sorted(days)]
+
+def load(day: str) -> ModuleType:
+    """Import dayN module by name.
+    Accepts 'dayN' as well as plain 'N'.
+    """
+    if (day.isdigit()):
+        day = f'day{day}'
+    return importlib.import_module(day)
+
+def input_file(module: ModuleType) -> str:
+    """Default input file of module's read_inputs."""
+    return inspect.signature(module.read_inputs).parameters['filename'].default
+
+def arguments(module: ModuleType, part: str, inputs: Any) -> Tuple[Any, ...]:
+    """Build argument tuple for part function of module from parsed inputs.
+
+    Days differ in how read_inputs results are handed to the parts:
+    tuples are unpacked if the part takes several arguments and parts
+    without arguments are called as-is. Inputs are copied, because
+    some parts modify their inputs in place.
+    """
+    func = getattr(module, part)
+    num_args = len(inspect.signature(func).parameters)
+
+    match (num_args):
+        case 0:
+            return ()
+        case 1:
+            return (deepcopy(inputs),)
+        case _ if (type(inputs) is tuple):
+            return deepcopy(inputs)
+        case _:
+            raise RuntimeError(f'Cannot pass inputs of type {type(inputs).__name__} to {module.__name__}.{part}!')
+
+def solve(module: ModuleType, part: str, inputs: Any) -> Any:
+    """Call part function of module with parsed inputs."""
+    return getattr(module, part)(*arguments(module, part, inputs))
@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Synthetic input generators for all days.
+
+Every generator takes a size and a random.Random instance and returns the
+input text in the same format as the bundled dayN_input files. The size is
+the approximate number of records: lines, groups, moves or grid cells,
+depending on the day.
+"""
+
+import argparse
+import atexit
+import json
+import logging
+import os
+import random
+import string
+import sys
+import tempfile
+
+from math import isqrt
+from typing import Callable, Dict, List
+
+from lib import setup
+
+__all__ = [
+    'GENERATORS',
+    'generate',
+    'write_temporary',
+]
+
+Generator = Callable[[int, random.Random], str]
+
+GENERATORS : Dict[str, Generator] = {}
+
+def register_generator(day: str) -> Callable[[Generator], Generator]:
+
+    def _register(generator: Generator) -> Generator:
+        GENERATORS[day] = generator
+        return generator
+
+    return _register
+
+@register_generator('day1')
+def generate_calories(size: int, rng: random.Random) -> str:
+    """size elves with 1 to 15 food items each."""
+    groups = ('\n'.join(str(rng.randint(1000, 60000)) for _ in range(rng.randint(1, 15))) for _ in range(size))
+    return '\n\n'.join(groups) + '\n'
+
+@register_generator('day2')
+def generate_rounds(size: int, rng: random.Random) -> str:
+    """size rounds of rock paper scissors."""
+    return ''.join(f'{rng.choice("ABC")} {rng.choice("XYZ")}\n' for _ in range(size))
+
+@register_generator('day3')
+def generate_rucksacks(size: int, rng: random.Random) -> str:
+    """size rucksacks (rounded up to groups of three).
+
+    Each group shares exactly one badge item and each rucksack has exactly
+    one item in both compartments, so that part 1 and part 2 are well-defined.
+    """
+    items = string.ascii_letters
+    lines = []
+
+    for _ in range(-(-size // 3)):
+        badge = rng.choice(items)
+        others = [item for item in items if item != badge]
+        rng.shuffle(others)
+
+        # disjoint pools per rucksack make the badge the only common item
+        for pool in (others[0:17], others[17:34], others[34:51]):
+            pool = pool + [badge]
+            shared = rng.choice(pool)
+            rest = [item for item in pool if item != shared]
+            lhs_items, rhs_items = rest[:len(rest) // 2], rest[len(rest) // 2:]
+            length = rng.randint(8, 16)
+            lhs = [shared] + [rng.choice(lhs_items) for _ in range(length - 1)]
+            rhs = [shared] + [rng.choice(rhs_items) for _ in range(length - 1)]
+            # make sure badge is packed
+            if (badge != shared):
+                (lhs if (badge in lhs_items) else rhs)[-1] = badge
+            rng.shuffle(lhs)
+            rng.shuffle(rhs)
+            lines.append(''.join(lhs) + ''.join(rhs))
+
+    return '\n'.join(lines) + '\n'
+
+@register_generator('day4')
+def generate_sections(size: int, rng: random.Random) -> str:
+    """size pairs of section assignments between 1 and 99."""
+
+    def _section() -> str:
+        begin = rng.randint(1, 99)
+        return f'{begin}-{rng.randint(begin, 99)}'
+
+    return ''.join(f'{_section()},{_section()}\n' for _ in range(size))
+
+@register_generator('day5')
+def generate_crates(size: int, rng: random.Random) -> str:
+    """Nine stacks holding about size crates in total and size moves."""
+    num_stacks = 9
+    heights = [rng.randint(1, max(1, 2 * size // num_stacks)) for _ in range(num_stacks)]
+    stacks = [[rng.choice(string.ascii_uppercase) for _ in range(height)] for height in heights]
+    max_height = max(heights)
+
+    lines = []
+    for level in range(max_height - 1, -1, -1):
+        lines.append(' '.join(f'[{stack[level]}]' if (level < len(stack)) else '   ' for stack in stacks))
+    lines.append(' '.join(f' {i} ' for i in range(1, num_stacks + 1)))
+    lines.append('')
+
+    for _ in range(size):
+        src = rng.choice([sid for sid in range(num_stacks) if heights[sid] > 0])
+        dst = rng.choice([sid for sid in range(num_stacks) if sid != src])
+        num = rng.randint(1, min(heights[src], 50))
+        heights[src] -= num
+        heights[dst] += num
+        lines.append(f'move {num} from {src + 1} to {dst + 1}')
+
+    return '\n'.join(lines) + '\n'
+
+@register_generator('day6')
+def generate_signal(size: int, rng: random.Random) -> str:
+    """Signal of about size characters with markers close to the end.
+
+    The bulk of the signal only uses three letters, so neither marker can
+    appear before the tail and a detector has to scan the whole signal.
+    """
+    prefix = ''.join(rng.choice('abc') for _ in range(size))
+    tail = list(string.ascii_lowercase)
+    rng.shuffle(tail)
+    return prefix + ''.join(tail) + '\n'
+
+@register_generator('day7')
+def generate_transcript(size: int, rng: random.Random) -> str:
+    """Shell transcript of a tree with about size entries.
+    File sizes shrink with size, so that even if all entries were files
+    they would fill at most 40000000 of the 70000000 disk and any directory
+    frees enough space. The first entry is a directory, so there is one.
+    """
+    max_file_size = min(300000, 40000000 // max(size, 1))
+    min_file_size = min(1000, max_file_size)
+    # build tree: each directory is a list of (name, size or subdirectory)
+    root : List = []
+    directories = [root]
+
+    for ix in range(size):
+        parent = rng.choice(directories)
+        if (ix == 0 or rng.random() < 0.2):
+            directory : List = []
+            directories.append(directory)
+            parent.append((f'd{ix}', directory))
+        else:
+            parent.append((f'f{ix}.{rng.choice(["txt", "dat", "log"])}', rng.randint(min_file_size, max_file_size)))
+
+    lines = ['$ cd /']
+    # walk tree depth first without recursion
+    stack = [iter([(None, root)])]
+    while (stack):
+        entry = next(stack[-1], None)
+        if (entry is None):
+            stack.pop()
+            if (len(stack) > 1):
+                lines.append('$ cd ..')
+            continue
+        name, directory = entry
+        if (name is not None):
+            lines.append(f'$ cd {name}')
+        lines.append('$ ls')
+        for child_name, child in directory:
+            lines.append(f'dir {child_name}' if (type(child) is list) else f'{child} {child_name}')
+        stack.append(iter([(child_name, child) for child_name, child in directory if type(child) is list]))
+
+    return '\n'.join(lines) + '\n'
+
+@register_generator('day8')
+def generate_trees(size: int, rng: random.Random) -> str:
+    """Square grid of about size trees."""
+    side = max(3, isqrt(size))
+    return ''.join(''.join(rng.choice(string.digits) for _ in range(side)) + '\n' for _ in range(side))
+
+@register_generator('day9')
+def generate_motions(size: int, rng: random.Random) -> str:
+    """size head motions of 1 to 20 steps."""
+    return ''.join(f'{rng.choice("RLUD")} {rng.randint(1, 20)}\n' for _ in range(size))
+
+@register_generator('day10')
+def generate_program(size: int, rng: random.Random) -> str:
+    """Program of size instructions (at least enough for 240 cycles)."""
+    lines = []
+    x = 1
+
+    for _ in range(max(size, 240)):
+        if (rng.random() < 0.3):
+            lines.append('noop')
+            continue
+        # keep sprite roughly on screen
+        value = rng.randint(-5, 5) + (1 if (x < 5) else (-1 if (x > 35) else 0))
+        x += value
+        lines.append(f'addx {value}')
+
+    return '\n'.join(lines) + '\n'
+
+@register_generator('day11')
+def generate_monkeys(size: int, rng: random.Random) -> str:
+    """Eight monkeys juggling size items in total."""
+    num_monkeys = 8
+    divisors = rng.sample([2, 3, 5, 7, 11, 13, 17, 19, 23], num_monkeys)
+    items : List[List[int]] = [[] for _ in range(num_monkeys)]
+    for _ in range(max(size, 1)):
+        items[rng.randrange(num_monkeys)].append(rng.randint(50, 99))
+    squarer = rng.randrange(num_monkeys)
+
+    blocks = []
+    for ix in range(num_monkeys):
+        if (ix == squarer):
+            operation = 'old * old'
+        else:
+            operation = f'old {rng.choice("+*")} {rng.randint(1, 9)}'
+        true, false = rng.sample([other for other in range(num_monkeys) if other != ix], 2)
+        blocks.append(f'Monkey {ix}:\n'
+                      f'  Starting items: {", ".join(str(worry) for worry in items[ix])}\n'
+                      f'  Operation: new = {operation}\n'
+                      f'  Test: divisible by {divisors[ix]}\n'
+                      f'    If true: throw to monkey {true}\n'
+                      f'    If false: throw to monkey {false}\n')
+
+    return '\n'.join(blocks)
+
+@register_generator('day12')
+def generate_heightmap(size: int, rng: random.Random) -> str:
+    """Heightmap of about size cells climbing from west to east.
+
+    Elevation rises by at most one per column and the middle row is kept
+    free of dips, so there always is a path from S to E.
+    """
+    width = max(26, isqrt(size))
+    height = max(1, size // width)
+    middle = height // 2
+    rows = []
+
+    for y in range(height):
+        row = []
+        for x in range(width):
+            elevation = 25 * x // (width - 1)
+            if (y != middle and rng.random() < 0.2):
+                elevation = max(0, elevation - rng.randint(1, 3))
+            row.append(chr(ord('a') + elevation))
+        rows.append(row)
+
+    rows[middle][0] = 'S'
+    rows[middle][-1] = 'E'
+    return ''.join(''.join(row) + '\n' for row in rows)
+
+@register_generator('day13')
+def generate_packets(size: int, rng: random.Random) -> str:
+    """size pairs of nested packets."""
+
+    def _packet(depth: int = 0) -> List:
+        contents = []
+        for _ in range(rng.randint(0, 4)):
+            if (depth < 4 and rng.random() < 0.3):
+                contents.append(_packet(depth + 1))
+            else:
+                contents.append(rng.randint(0, 10))
+        return contents
+
+    def _dump(packet: List) -> str:
+        return json.dumps(packet, separators=(',', ':'))
+
+    return '\n'.join(f'{_dump(_packet())}\n{_dump(_packet())}\n' for _ in range(size))
+
+def generate(day: str, size: int, seed: int = 0) -> str:
+    """Generate input text of given size for day."""
+    if (day not in GENERATORS):
+        raise ValueError(f'No generator for \'{day}\'!')
+    return GENERATORS[day](size, random.Random(seed))
+
+def _remove(path: str):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def write_temporary(text: str, day: str) -> str:
+    """Write generated text to a temporary file
+    that is removed when the interpreter exits
+    unless it was removed earlier.
+    """
+    fd, path = tempfile.mkstemp(prefix=f'{day}_', suffix='_input')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(text)
+    atexit.register(_remove, path)
+    return path
+
+def install_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('day', help='Day to generate input for, e.g. \'day1\' or \'1\'.', type=str)
+    parser.add_argument('size', help='Approximate number of records.', type=int)
+    parser.add_argument('--output', help='Output file (default: stdout).', type=str, default=None)
+
+def main(args):
+
+    day = args.day if (not args.day.isdigit()) else f'day{args.day}'
+    text = generate(day, args.size, args.seed)
+
+    if (args.output is None):
+        sys.stdout.write(text)
+    else:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text)
+        logging.info(f'Wrote {len(text)} characters to {args.output}')
+
+if __name__ == '__main__':
+    args = setup(install_arguments)
+    sys.exit(main(args))
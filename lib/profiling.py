@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import atexit
+import cProfile
+import functools
+import io
+import logging
+import pstats
+import re
+import tracemalloc
+
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+__all__ = [
+    'PROFILE_MODES',
+    'PHASES',
+    'install',
+]
+
+PROFILE_MODES = ('cpu', 'mem')
+
+PHASES = ('read_inputs', 'part1', 'part2')
+
+# entry points of alternative engines, e.g. solve_numpy or part1_bitmask
+ENGINE_PATTERN = re.compile(r'solve_\w+|part[12]_\w+')
+
+def _profile_cpu(func: Callable[..., Any], name: str, outdir: Path, top: int, *args, **kwargs) -> Any:
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        path = outdir / f'{name}.pstats'
+        profiler.dump_stats(path)
+        summary = io.StringIO()
+        pstats.Stats(profiler, stream=summary).sort_stats(pstats.SortKey.TIME).print_stats(top)
+        logging.info(f'Profile {name} (written to {path})\n{summary.getvalue().strip()}')
+
+def _profile_mem(func: Callable[..., Any], name: str, outdir: Path, top: int, *args, **kwargs) -> Any:
+
+    tracemalloc.start()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        path = outdir / f'{name}.tracemalloc'
+        snapshot.dump(str(path))
+        sites = '\n'.join(str(stat) for stat in snapshot.statistics('lineno')[:top])
+        logging.info(f'Memory {name}: peak {peak / 1024:.1f} KiB, retained {current / 1024:.1f} KiB (written to {path})\n{sites}')
+
+def install(module: ModuleType, mode: str, outdir: str = '.', top: int = 10):
+    """Replace read_inputs, part1, part2 and engine entry points
+    (solve_*, part1_*, part2_*) of module with profiling wrappers.
+
+    The day scripts look these functions up in their module globals when
+    main() runs, so wrapping them after setup() profiles each phase without
+    changes to the scripts. Calls made while a phase is already being
+    profiled (e.g. part2 calling part1) are attributed to the outer phase.
+    If none of them but read_inputs is called, a warning is logged at exit.
+    """
+    match (mode):
+        case 'cpu':
+            profile = _profile_cpu
+        case 'mem':
+            profile = _profile_mem
+        case _:
+            raise ValueError(f'Unknown profile mode \'{mode}\'!')
+
+    outdir = Path(outdir)
+    outdir.mkdir(parents=True, exist_ok=True)
+    day = Path(getattr(module, '__file__', None) or module.__name__).stem
+    active = False
+    solved = False
+
+    def _wrap(phase: str, func: Callable[..., Any]) -> Callable[..., Any]:
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal active, solved
+
+            if (active):
+                return func(*args, **kwargs)
+
+            active = True
+            solved = solved or (phase != 'read_inputs')
+            try:
+                return profile(func, f'{day}_{phase}', outdir, top, *args, **kwargs)
+            finally:
+                active = False
+
+        return wrapper
+
+    def _check():
+        if (not solved):
+            logging.warning(f'Solver of {day} was not profiled, the selected engine has no entry point among '
+                            f'part1, part2, solve_*, part1_* or part2_*')
+
+    for name, func in list(vars(module).items()):
+        if (not callable(func) or getattr(func, '__module__', None) != module.__name__):
+            continue
+        if (name in PHASES or ENGINE_PATTERN.fullmatch(name)):
+            setattr(module, name, _wrap(name, func))
+
+    atexit.register(_check)
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import time
+
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+__all__ = [
+    'Viewport',
+    'Canvas',
+    'FrameThrottle',
+    'configure',
+    'clip',
+]
+
+# defaults for all renderers, set from command line by lib.setup
+_every : int = 1
+_fps : Optional[float] = None
+_max_size : Optional[Tuple[int, int]] = None
+
+def configure(every: int = 1, fps: Optional[float] = None, max_size: Optional[Tuple[int, int]] = None):
+    """Set defaults for frame throttling and viewport size."""
+    global _every, _fps, _max_size
+    _every = max(1, every)
+    _fps = fps
+    _max_size = max_size
+
+@dataclass(frozen=True)
+class Viewport:
+    x: int
+    y: int
+    w: int
+    h: int
+
+def clip(x: int, y: int, w: int, h: int, focus: Optional[Tuple[int, int]] = None) -> Viewport:
+    """Clip area to configured maximum viewport size,
+    centered on focus (default: center of area).
+    """
+    if (_max_size is None):
+        return Viewport(x, y, w, h)
+
+    max_w, max_h = _max_size
+    fx, fy = focus if (focus is not None) else (x + w // 2, y + h // 2)
+    vw = min(w, max_w)
+    vh = min(h, max_h)
+    vx = min(max(x, fx - vw // 2), x + w - vw)
+    vy = min(max(y, fy - vh // 2), y + h - vh)
+    return Viewport(vx, vy, vw, vh)
+
+class Canvas:
+    """Text frame backed by a preallocated bytearray.
+
+    Coordinates are in world space, anything outside the viewport is
+    dropped. With y_up, larger y values are drawn further up.
+    """
+    def __init__(self, viewport: Viewport, background: str = '.', y_up: bool = False):
+        self.viewport = viewport
+        self.y_up = y_up
+        self.stride = viewport.w + 1
+        row = background.encode('ascii') * viewport.w + b'\n'
+        self.buffer = bytearray(row * viewport.h)
+
+    def _offset(self, x: int, y: int) -> Optional[int]:
+
+        lx = x - self.viewport.x
+        ly = y - self.viewport.y
+        if (not (0 <= lx < self.viewport.w and 0 <= ly < self.viewport.h)):
+            return None
+        if (self.y_up):
+            ly = self.viewport.h - 1 - ly
+        return ly * self.stride + lx
+
+    def put(self, x: int, y: int, char: str):
+
+        offset = self._offset(x, y)
+        if (offset is not None):
+            self.buffer[offset] = ord(char)
+
+    def text(self, x: int, y: int, text: str):
+
+        lx = x - self.viewport.x
+        begin = max(0, -lx)
+        end = min(len(text), self.viewport.w - lx)
+        if (begin >= end):
+            return
+        offset = self._offset(x + begin, y)
+        if (offset is not None):
+            self.buffer[offset:offset + end - begin] = text[begin:end].encode('ascii')
+
+    def render(self) -> str:
+        return self.buffer[:-1].decode('ascii')
+
+class FrameThrottle:
+    """Decide which frames of an animation are drawn.
+    Only every nth frame is drawn and at most fps frames per second.
+    """
+    def __init__(self, every: Optional[int] = None, fps: Optional[float] = None):
+        self.every = max(1, every) if (every is not None) else _every
+        fps = fps if (fps is not None) else _fps
+        self.interval = 1.0 / fps if (fps) else 0.0
+        self.frame = 0
+        self.last : Optional[float] = None
+
+    def ready(self) -> bool:
+
+        frame = self.frame
+        self.frame += 1
+
+        if (frame % self.every):
+            return False
+
+        if (self.interval):
+            now = time.monotonic()
+            if (self.last is not None and now - self.last < self.interval):
+                return False
+            self.last = now
+
+        return True
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from lib import cache, parse_loglevel, setup
+from lib.days import PARTS, ROOT, discover, input_file, load, solve
+
+__all__ = [
+    'PartResult',
+    'run_part',
+    'run_all',
+]
+
+@dataclass
+class PartResult:
+    day:     str
+    part:    str
+    answer:  Any = None
+    parse:   float = 0.0
+    solve:   float = 0.0
+    error:   Optional[str] = None
+    cached:  bool = False
+
+def _init_worker(loglevel: int, cache_settings: Dict[str, Any]):
+    # workers import dayN modules relative to the repository root
+    os.chdir(ROOT)
+    if (str(ROOT) not in sys.path):
+        sys.path.insert(0, str(ROOT))
+    logging.getLogger().setLevel(loglevel)
+    # spawned workers do not inherit cache settings
+    cache.configure(**cache_settings)
+
+def run_part(day: str, part: str) -> PartResult:
+    """Parse inputs and solve a single part of a day.
+    With caching enabled, answers are memoized on disk.
+    """
+    result = PartResult(day, part)
+
+    try:
+        module = load(day)
+
+        if (cache.enabled()):
+            key = cache.answer_key(module, part, input_file(module))
+            try:
+                result.answer = cache.load('answers', key)
+                result.cached = True
+                return result
+            except KeyError:
+                pass
+
+        start = time.perf_counter()
+        inputs = module.read_inputs()
+        result.parse = time.perf_counter() - start
+        start = time.perf_counter()
+        result.answer = solve(module, part, inputs)
+        result.solve = time.perf_counter() - start
+
+        if (cache.enabled()):
+            cache.store('answers', key, result.answer)
+    except Exception as e:
+        result.error = f'{type(e).__name__}: {e}'
+
+    return result
+
+def _format_answer(answer: Any, width: int = 48) -> str:
+
+    text = str(answer)
+    if ('\n' in text):
+        text = text.splitlines()[0] + ' ...'
+    if (len(text) > width):
+        text = text[:width - 4] + ' ...'
+    return text
+
+def _format_table(results: List[PartResult], wall: float) -> str:
+
+    lines = [f'{"Day":<6} {"Part":<6} {"Parse":>9} {"Solve":>9}  Answer']
+    cpu = 0.0
+
+    for r in results:
+        answer = f'ERROR {r.error}' if (r.error is not None) else _format_answer(r.answer)
+        if (r.cached):
+            lines.append(f'{r.day:<6} {r.part:<6} {"cached":>9} {"cached":>9}  {answer}')
+        else:
+            lines.append(f'{r.day:<6} {r.part:<6} {r.parse:>8.3f}s {r.solve:>8.3f}s  {answer}')
+        cpu += r.parse + r.solve
+
+    lines.append(f'Wall time {wall:.3f}s, sum of part times {cpu:.3f}s')
+    if (cache.enabled()):
+        hits = sum(1 for r in results if r.cached)
+        lines.append(f'Answer cache: {hits} hits, {len(results) - hits} misses')
+    return '\n'.join(lines)
+
+def run_all(days: Optional[List[str]] = None, workers: Optional[int] = None, loglevel: int = logging.WARNING) -> List[PartResult]:
+    """Run part1 and part2 of all days in a process pool
+    and return results in day order.
+    """
+    if (days is None):
+        days = discover()
+
+    order = {(day, part): i for i, (day, part) in enumerate((day, part) for day in days for part in PARTS)}
+    results : Dict[int, PartResult] = {}
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(loglevel, cache.settings())) as pool:
+        futures = [pool.submit(run_part, day, part) for day, part in order]
+        for future in as_completed(futures):
+            result = future.result()
+            results[order[(result.day, result.part)]] = result
+
+    return [results[i] for i in sorted(results)]
+
+def install_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument('days', help='Days to run, e.g. \'day1\' or \'1\' (default: all).', nargs='*')
+    parser.add_argument('--workers', help='Number of worker processes (default: number of CPUs).', type=int, default=None)
+    parser.add_argument('--worker-loglevel', help='Loglevel inside workers (default: \'WARNING\').', type=str, default='WARNING')
+
+def main(args):
+
+    days = [day if (not day.isdigit()) else f'day{day}' for day in args.days] or None
+    loglevel = parse_loglevel(args.worker_loglevel)
+    if (loglevel is None):
+        logging.error(f'Invalid worker loglevel \'{args.worker_loglevel}\' passed. Exiting...')
+        return -1
+
+    start = time.perf_counter()
+    results = run_all(days, workers=args.workers, loglevel=loglevel)
+    wall = time.perf_counter() - start
+
+    logging.info(f'Results\n{_format_table(results, wall)}')
+    return 0 if all(r.error is None for r in results) else 1
+
+if __name__ == '__main__':
+    args = setup(install_arguments)
+    sys.exit(main(args))